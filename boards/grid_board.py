@@ -9,12 +9,14 @@ Used by:
     • Pairs             – flipping card pairs
 
 The board itself does *no* game rules; it only:
-    1. Manages a 2‑D array of "cells" (dicts by default).
+    1. Manages a 2‑D array of "cells" (dicts by default, or a contiguous
+       NumPy array when a *dtype* is given – e.g. uint8 tile ids).
     2. Converts between (row, col) <‑‑> pixel coordinates.
     3. Provides convenience drawing helpers.
 """
 from __future__ import annotations
-from typing import Callable, Any, Tuple, List
+from typing import Callable, Any, Tuple, List, Sequence
+import numpy as np
 import pygame
 
 class GridBoard:
@@ -25,45 +27,86 @@ class GridBoard:
         cell_size: int = 32,
         origin: Tuple[int, int] = (0, 0),
         cell_factory: Callable[[], Any] | None = None,
+        dtype: np.typing.DTypeLike | None = None,
+        skip_cells: bool = False,
     ):
         self.rows      = rows
         self.cols      = cols
         self.cell_size = cell_size
         self.origin    = origin
         self._factory  = cell_factory or (lambda: {})
-        self.grid: List[List[Any]] = [
-            [self._factory() for _ in range(cols)] for _ in range(rows)
-        ]
+        self.grid: List[List[Any]] | np.ndarray | None
+        if skip_cells:
+            # geometry/drawing only – the game keeps its own state
+            self.grid = None
+        elif dtype is not None:
+            # flat numeric cells (0 = empty) → one contiguous array
+            self.grid = np.zeros((rows, cols), dtype=dtype)
+        else:
+            self.grid = [
+                [self._factory() for _ in range(cols)] for _ in range(rows)
+            ]
 
         # cached surfaces for lines
         self._grid_surf = self._build_grid_surface()
 
     # ───────────────────────────── geometry ──────────────────────────
+    @property
+    def origin(self) -> Tuple[int, int]:
+        return self._origin
+
+    @origin.setter
+    def origin(self, origin: Tuple[int, int]) -> None:
+        # bare ints so the per‑cell helpers skip the tuple unpack
+        self._origin = origin
+        self._ox, self._oy = origin
+        # pixel left edge of every column / top edge of every row
+        self.col_x = self._ox + np.arange(self.cols, dtype=np.intp) * self.cell_size
+        self.row_y = self._oy + np.arange(self.rows, dtype=np.intp) * self.cell_size
+
     def cell_to_pixel(self, row: int, col: int) -> Tuple[int, int]:
-        ox, oy = self.origin
-        return ox + col * self.cell_size, oy + row * self.cell_size
+        return self._ox + col * self.cell_size, self._oy + row * self.cell_size
+
+    def cell_to_pixel_array(self, rows: np.ndarray, cols: np.ndarray
+                            ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorised `cell_to_pixel`: arrays of in‑range rows/cols → (xs, ys),
+        looked up in the per‑column/row tables.
+        """
+        return self.col_x[cols], self.row_y[rows]
 
     def pixel_to_cell(self, x: int, y: int) -> Tuple[int, int] | None:
-        ox, oy = self.origin
-        col = (x - ox) // self.cell_size
-        row = (y - oy) // self.cell_size
+        col = (x - self._ox) // self.cell_size
+        row = (y - self._oy) // self.cell_size
         if 0 <= row < self.rows and 0 <= col < self.cols:
             return row, col
         return None
 
+    # ─────────────────────── array‑backed helpers ────────────────────
+    def clear_rows(self, rows: Sequence[int]) -> None:
+        """
+        Remove *rows* and drop everything above them down, in place
+        (dtype boards only).  Outside references to ``grid`` stay valid.
+        """
+        if not len(rows):
+            return
+        kept = np.delete(self.grid, rows, axis=0)
+        self.grid[:len(rows)] = 0
+        self.grid[len(rows):] = kept
+
     # ─────────────────────────── rendering ───────────────────────────
     def _build_grid_surface(self) -> pygame.Surface:
         w = self.cols * self.cell_size
         h = self.rows * self.cell_size
         surf = pygame.Surface((w, h), pygame.SRCALPHA)
-        # draw grid lines once
-        c = (80, 80, 80)
+        # draw grid lines once – 1‑px rect fills (the last line of each
+        # axis falls just outside the surface, exactly as draw.line clipped)
+        c  = (80, 80, 80)
+        cs = self.cell_size
         for r in range(self.rows + 1):
-            y = r * self.cell_size
-            pygame.draw.line(surf, c, (0, y), (w, y), width=1)
+            surf.fill(c, (0, r * cs, w, 1))
         for cidx in range(self.cols + 1):
-            x = cidx * self.cell_size
-            pygame.draw.line(surf, c, (x, 0), (x, h), width=1)
+            surf.fill(c, (cidx * cs, 0, 1, h))
         return surf
 
     def draw(self, target: pygame.Surface) -> None:
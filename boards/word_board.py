@@ -15,6 +15,7 @@ import pygame
 
 class WordBoard:
     KEY_ROWS = ["QWERTYUIOP", "ASDFGHJKL", "ZXCVBNM"]
+    GLYPHS   = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 
     def __init__(
         self,
@@ -30,16 +31,58 @@ class WordBoard:
         self.slot_size = slot_size
         self.gap       = gap
         self.origin    = origin
-        self.font      = font or pygame.font.Font(None, slot_size - 10)
+        self.font      = font or pygame.font.Font(None, slot_size - 10)   # builds glyph cache
 
         # state
         self.grid: List[str] = ["" for _ in range(guesses)]   # current letters
         self.key_states: Dict[str, str] = {}  # letter -> "unset"/"miss"/"hit"/"close"
 
+        # pre‑render the empty guess grid
+        self._grid_surf = self._build_grid_surface()
+
         # pre‑render static keyboard
         self._keyboard_rects: Dict[str, pygame.Rect] = {}
         self._keyboard_surf = self._build_keyboard_surface()
 
+    # ───────────────────────── glyph cache ───────────────────────────
+    @property
+    def font(self) -> pygame.font.Font:
+        return self._font
+
+    @font.setter
+    def font(self, font: pygame.font.Font) -> None:
+        # re-rasterise the A–Z atlas whenever the font is swapped
+        self._font = font
+        self._glyph_cache: Dict[str, pygame.Surface] = {}
+        self._glyph_rects: Dict[str, pygame.Rect]    = {}
+        for ch in self.GLYPHS:
+            self._cache_glyph(ch)
+
+    def _cache_glyph(self, ch: str) -> pygame.Surface:
+        """Render *ch* once; its rect is centred in a slot at (0, 0)."""
+        label = self._font.render(ch, True, (240, 240, 240))
+        half  = self.slot_size // 2
+        self._glyph_cache[ch] = label
+        self._glyph_rects[ch] = label.get_rect(center=(half, half))
+        return label
+
+    # ─────────────────────────── grid surface ────────────────────────
+    def _grid_geometry(self) -> Tuple[int, int, int, int]:
+        return self.guesses, self.word_len, self.slot_size, self.gap
+
+    def _build_grid_surface(self) -> pygame.Surface:
+        step = self.slot_size + self.gap
+        w    = max(0, self.word_len * step - self.gap)
+        h    = max(0, self.guesses  * step - self.gap)
+        surf = pygame.Surface((w, h), pygame.SRCALPHA)
+        for r in range(self.guesses):
+            for c in range(self.word_len):
+                pygame.draw.rect(surf, (200, 200, 200),
+                                 (c * step, r * step, self.slot_size, self.slot_size),
+                                 width=2)
+        self._grid_geom = self._grid_geometry()
+        return surf
+
     # ───────────────────────── keyboard surface ──────────────────────
     def _build_keyboard_surface(self) -> pygame.Surface:
         row_h = self.slot_size + self.gap
@@ -47,11 +90,15 @@ class WordBoard:
         kb_h  = row_h * len(self.KEY_ROWS)
         surf  = pygame.Surface((kb_w, kb_h), pygame.SRCALPHA)
 
+        # per-row left edge, used by key_from_pos for O(1) lookup
+        self._kb_row_x0: List[int] = []
+
         y = 0
         for row in self.KEY_ROWS:
             # centre each row
             row_w = len(row) * self.slot_size + (len(row) - 1) * self.gap
             x = (kb_w - row_w) // 2
+            self._kb_row_x0.append(x)
             for ch in row:
                 rect = pygame.Rect(x, y, self.slot_size, self.slot_size)
                 self._keyboard_rects[ch] = rect
@@ -65,18 +112,20 @@ class WordBoard:
     # ─────────────────────────── rendering ───────────────────────────
     def draw(self, target: pygame.Surface) -> None:
         ox, oy = self.origin
-        # draw guess grid
+        # empty grid is one cached blit; only the letters are overlaid
+        if self._grid_geom != self._grid_geometry():
+            self._grid_surf = self._build_grid_surface()
+        target.blit(self._grid_surf, (ox, oy))
+
+        letters: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
         for r in range(self.guesses):
             y = oy + r * (self.slot_size + self.gap)
-            for c in range(self.word_len):
-                x = ox + c * (self.slot_size + self.gap)
-                pygame.draw.rect(target, (200, 200, 200),
-                                 (x, y, self.slot_size, self.slot_size), width=2)
-                if c < len(self.grid[r]):
-                    ch = self.grid[r][c]
-                    label = self.font.render(ch, True, (240, 240, 240))
-                    target.blit(label, label.get_rect(center=(x + self.slot_size//2,
-                                                              y + self.slot_size//2)))
+            for c, ch in enumerate(self.grid[r][:self.word_len]):
+                x     = ox + c * (self.slot_size + self.gap)
+                label = self._glyph_cache.get(ch) or self._cache_glyph(ch)
+                rect  = self._glyph_rects[ch]
+                letters.append((label, (x + rect.x, y + rect.y)))
+        target.blits(letters, doreturn=False)
         # draw keyboard
         kb_y = oy + self.guesses * (self.slot_size + self.gap) + 30
         target.blit(self._keyboard_surf, (ox, kb_y))
@@ -84,12 +133,17 @@ class WordBoard:
     # ───────────────────────── hit testing ───────────────────────────
     def key_from_pos(self, pos: Tuple[int, int]) -> str | None:
         ox, oy = self.origin
-        kb_y   = oy + self.guesses * (self.slot_size + self.gap) + 30
-        rel    = (pos[0] - ox, pos[1] - kb_y)
-        for ch, rect in self._keyboard_rects.items():
-            if rect.collidepoint(rel):
-                return ch
-        return None
+        step   = self.slot_size + self.gap
+        kb_y   = oy + self.guesses * step + 30
+        # keys sit on a regular grid per row → pure arithmetic, no scan
+        ry, dy = divmod(pos[1] - kb_y, step)
+        if not 0 <= ry < len(self.KEY_ROWS) or dy >= self.slot_size:
+            return None
+        row    = self.KEY_ROWS[ry]
+        cx, dx = divmod(pos[0] - ox - self._kb_row_x0[ry], step)
+        if not 0 <= cx < len(row) or dx >= self.slot_size:
+            return None
+        return row[cx]
 
     # ───────────────────────── stubs for games ───────────────────────
     def handle_event(self, event: pygame.event.Event) -> None:
@@ -15,6 +15,12 @@ FONT_NAME  = pygame.font.get_default_font()
 ICON_SIZE  = (120, 120)
 DROP_SIZE  = (340, 340)
 
+# Window events after which the OS needs the whole frame presented again
+REPAINT_EVENTS = (
+    pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWSHOWN,
+    pygame.WINDOWRESTORED, pygame.WINDOWFOCUSGAINED,
+)
+
 # Assets ---------------------------------------------------------------
 PROJECT_ROOT = Path(__file__).parent
 COVERS_DIR   = PROJECT_ROOT / "assets" / "covers"
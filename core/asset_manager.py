@@ -2,17 +2,64 @@
 AssetManager  –  now size‑aware.
 
 It caches each (filename, size) pair separately so we never upscale a
-thumbnail; every unique size is rendered directly from the source file once.
+thumbnail; every unique size is scaled from the full‑size source once.
+The decoded source itself is cached too, so N sizes cost one decode.
+On pygame‑ce, SVG covers are rasterised straight at the requested size
+instead (no bitmap resample at all).
+Covers that fail to load share one coloured square per (colour, size).
+
+`load_image` / `load_scaled` are the process‑wide equivalents for game
+parts, so restarting a scene doesn’t decode and rescale its sprites again;
+`load_font` does the same for fonts.
 """
 from __future__ import annotations
 from pathlib import Path
+import zlib
 import pygame
 
+# placeholder colours for covers that can’t be loaded
+FALLBACK_COLOURS = (
+    (180,50,50), (50,180,50), (50,50,180),
+    (200,120,40), (180,50,180), (50,180,180), (180,180,50),
+)
+
+# ───────────────────── shared game‑part images ─────────────────────
+# Callers share these Surfaces – blit them, never draw onto them.
+_IMG_CACHE: dict[tuple[Path, tuple[int,int]|None], pygame.Surface] = {}
+
+def load_image(path: Path) -> pygame.Surface:
+    """Decode *path* (convert_alpha'd) once per process."""
+    surf = _IMG_CACHE.get((path, None))
+    if surf is None:
+        surf = _IMG_CACHE[(path, None)] = pygame.image.load(path).convert_alpha()
+    return surf
+
+def load_scaled(path: Path, size: tuple[int, int]) -> pygame.Surface:
+    """`load_image` smoothscaled to *size*, cached per (path, size)."""
+    surf = _IMG_CACHE.get((path, size))
+    if surf is None:
+        surf = _IMG_CACHE[(path, size)] = pygame.transform.smoothscale(load_image(path), size)
+    return surf
+
+_FONT_CACHE: dict[tuple[str|None, int], pygame.font.Font] = {}
+
+def load_font(name: str|None, size: int) -> pygame.font.Font:
+    """`pygame.font.Font(name, size)`, opened once per process."""
+    font = _FONT_CACHE.get((name, size))
+    if font is None:
+        font = _FONT_CACHE[(name, size)] = pygame.font.Font(name, size)
+    return font
+
 class AssetManager:
     def __init__(self, covers_dir: Path):
         self.covers_dir = covers_dir
         # key = (filename, size‑tuple or None)  -> pygame.Surface
         self._cache: dict[tuple[str, tuple[int,int]|None], pygame.Surface] = {}
+        # key = filename -> decoded, unscaled pygame.Surface
+        self._source_cache: dict[str, pygame.Surface] = {}
+        # key = (colour, size‑tuple) -> shared placeholder Surface
+        self._fallback_cache: dict[tuple[tuple[int,int,int], tuple[int,int]], pygame.Surface] = {}
+        self._missing: set[str] = set()
 
     # ----------------------------------------------------------------
     def get_icon(self, filename: str, size: tuple[int, int] | None) -> pygame.Surface:
@@ -24,19 +71,49 @@ class AssetManager:
         if key in self._cache:
             return self._cache[key]
 
+        surf = self._source(filename) if size is None else self._sized(filename, size)
+        self._cache[key] = surf
+        return surf
+
+    # ----------------------------------------------------------------
+    def _sized(self, filename: str, size: tuple[int, int]) -> pygame.Surface:
+        if filename in self._missing:
+            return self._fallback(filename, size)
+        if filename.endswith(".svg") and hasattr(pygame.image, "load_sized_svg"):
+            try:
+                return pygame.image.load_sized_svg(
+                    self.covers_dir / filename, size
+                ).convert_alpha()
+            except Exception:
+                pass                    # fall back to the cached source below
+        src = self._source(filename)
+        if filename in self._missing:
+            return self._fallback(filename, size)
+        if src.get_size() == size:
+            return src
+        return pygame.transform.smoothscale(src, size)
+
+    def _source(self, filename: str) -> pygame.Surface:
+        surf = self._source_cache.get(filename)
+        if surf is None:
+            surf = self._source_cache[filename] = self._load_source(filename)
+        return surf
+
+    def _load_source(self, filename: str) -> pygame.Surface:
         path = self.covers_dir / filename
         try:
-            surf = pygame.image.load(path).convert_alpha()
+            return pygame.image.load(path).convert_alpha()
         except Exception:
             # fallback = coloured square if the file can’t load
-            colour = [(180,50,50),(50,180,50),(50,50,180),
-                      (200,120,40),(180,50,180),(50,180,180),(180,180,50)
-                     ][hash(filename)%7]
-            surf = pygame.Surface((256,256), pygame.SRCALPHA)
-            surf.fill(colour)
-
-        if size is not None:
-            surf = pygame.transform.smoothscale(surf, size)
+            self._missing.add(filename)
+            return self._fallback(filename, (256,256))
 
-        self._cache[key] = surf
+    def _fallback(self, filename: str, size: tuple[int, int]) -> pygame.Surface:
+        # crc32, not hash(): str hashes change from run to run
+        colour = FALLBACK_COLOURS[zlib.crc32(filename.encode()) % len(FALLBACK_COLOURS)]
+        surf = self._fallback_cache.get((colour, size))
+        if surf is None:
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+            surf.fill(colour)
+            self._fallback_cache[(colour, size)] = surf
         return surf
@@ -1,6 +1,7 @@
 # core/game_registry.py
 
 from __future__ import annotations
+import importlib
 import pygame
 from typing import Dict, List, Tuple, Callable, Optional, Any
 
@@ -8,6 +9,8 @@ class GameRegistry:
     def __init__(self):
         # name → (cover_file, launcher_callable?, difficulties_mapping?)
         self._registry: Dict[str, Tuple[str, Optional[Callable[..., Any]], Optional[Dict[str, dict]]]] = {}
+        # name → scene module not imported yet (see register_lazy)
+        self._lazy: Dict[str, str] = {}
 
     def register(
         self,
@@ -19,8 +22,22 @@ class GameRegistry:
         """
         difficulties: mapping difficulty_name → kwargs dict for that game.
         """
+        self._lazy.pop(name, None)
         self._registry[name] = (cover_file, launcher, difficulties)
 
+    def register_lazy(self, name: str, module: str) -> None:
+        """
+        Defer importing *module* until *name* is first selected or launched.
+        The module's own ``register(registry)`` hook then fills in the
+        launcher and difficulties.  *name* must already have a cover.
+        """
+        self._lazy[name] = module
+
+    def _resolve(self, name: str) -> None:
+        module = self._lazy.pop(name, None)
+        if module is not None:
+            importlib.import_module(module).register(self)
+
     def all_games(self) -> List[str]:
         return list(self._registry.keys())
 
@@ -28,10 +45,12 @@ class GameRegistry:
         return self._registry[name][0]
 
     def launcher(self, name: str) -> Callable[..., Any] | None:
+        self._resolve(name)
         return self._registry[name][1]
 
     def difficulties(self, name: str) -> dict[str, dict]:
         """Return the mapping of difficulty→kwargs, or empty dict."""
+        self._resolve(name)
         diffs = self._registry[name][2]
         return diffs or {}
 
@@ -47,6 +66,7 @@ class GameRegistry:
         if name not in self._registry:
             print(f"[Registry] No such game: {name}")
             return None
+        self._resolve(name)
         _, launcher, _ = self._registry[name]
         if not launcher:
             print(f"[Registry] No launcher defined for game: {name}")
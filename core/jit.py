@@ -0,0 +1,28 @@
+"""
+Optional Numba JIT.
+
+`njit` compiles with numba when it is installed and is a pass‑through
+decorator otherwise, so kernels written against NumPy arrays still run
+(just slower) in plain Python.
+"""
+from __future__ import annotations
+from typing import Any, Callable
+
+try:
+    from numba import njit as _numba_njit   # type: ignore
+except ImportError:
+    _numba_njit = None
+
+HAVE_NUMBA = _numba_njit is not None
+
+
+def njit(*args: Any, **kwargs: Any) -> Any:
+    """Drop‑in for ``numba.njit`` – bare, with a signature, or with options."""
+    if _numba_njit is not None:
+        return _numba_njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]                       # used as @njit
+
+    def passthrough(fn: Callable[..., Any]) -> Callable[..., Any]:
+        return fn
+    return passthrough                       # used as @njit(...)
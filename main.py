@@ -1,48 +1,72 @@
 """
 main.py
 
-Entry point.  Builds registry via auto-discovery, launches menu, and
+Entry point.  Builds registry from scenes.SCENE_MODULES, launches menu, and
 runs a generic loop that swaps into any Scene returned by registry.launch_game.
 """
 
 import sys
 import pygame
 
-from config              import WIDTH, HEIGHT, FPS, GAMES, COVERS_DIR
+from config              import WIDTH, HEIGHT, FPS, GAMES, COVERS_DIR, REPAINT_EVENTS
 from core.asset_manager  import AssetManager
 from core.game_registry  import GameRegistry
 from scenes.loader       import register_all
 from ui.menu             import MenuUI
 
+# Event types any scene reacts to; everything else is dropped by SDL before
+# it reaches Python.  MOUSEMOTION is only let through for scenes that set
+# `wants_motion` (see _allow_motion).  Expose/restore/focus events pass
+# too: scenes that skip idle frames need them to repaint.
+EVENT_WHITELIST = [
+    pygame.QUIT,
+    pygame.KEYDOWN, pygame.KEYUP,
+    pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL,
+    pygame.USEREVENT,
+    *REPAINT_EVENTS,
+]
+
 def build_registry() -> GameRegistry:
     reg = GameRegistry()
     # 1) register all covers (placeholders for combos & unimplemented games)
     for name, cover in GAMES:
         reg.register(name, cover)
-    # 2) auto-discover & register any scenes with register(registry)
+    # 2) hook up scenes.SCENE_MODULES; their modules load on first use
     register_all(reg)
     return reg
 
+def _allow_motion(scene) -> None:
+    if getattr(scene, "wants_motion", False):
+        pygame.event.set_allowed(pygame.MOUSEMOTION)
+    else:
+        pygame.event.set_blocked(pygame.MOUSEMOTION)
+
 def main() -> None:
     pygame.init()
     pygame.display.set_caption("GameAlchemy")
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     clock  = pygame.time.Clock()
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(EVENT_WHITELIST)
 
     registry = build_registry()
     assets   = AssetManager(COVERS_DIR)
 
     menu    = MenuUI(screen, registry, assets)
     current = menu
+    _allow_motion(current)
 
     running = True
     while running:
         dt = clock.tick(FPS) / 1000.0
+        repaint = False
 
         for ev in pygame.event.get():
             if ev.type == pygame.QUIT:
                 running = False
                 break
+            if ev.type in REPAINT_EVENTS:
+                repaint = True          # window contents lost: present it all
 
             # dispatch to current scene/menu
             result = current.handle_event(ev)
@@ -55,6 +79,7 @@ def main() -> None:
                     scene = registry.launch_game(name, screen, **params)
                     if scene:
                         current = scene
+                        _allow_motion(current)
                 elif cmd == "mix":
                     # mixing is internal to MenuUI
                     pass
@@ -63,11 +88,17 @@ def main() -> None:
             # 🔄 Game scene → back to menu
             if not isinstance(current, MenuUI) and result == "menu":
                 current = menu
+                _allow_motion(current)
                 continue
 
         current.update(dt)
-        current.draw()
-        pygame.display.flip()
+        # scenes may return the rects they touched; None means the whole screen
+        dirty = current.draw()
+        if dirty is None or repaint:
+            # the screen Surface always holds the full last frame
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty)
 
     pygame.quit()
     sys.exit()
@@ -1,4 +1,14 @@
 # scenes/__init__.py
-from .minesweeper import MinesweeperScene
+# Scene modules are imported on demand (see loader.register_all), so the
+# public re-export is resolved lazily too.
 
-__all__ = ["MinesweeperScene"]
+# every scene module with a register(registry) hook – add new scenes here
+SCENE_MODULES = ("bricklayer", "hangman", "minesweeper", "pipeline", "snake", "wordit")
+
+__all__ = ["MinesweeperScene", "SCENE_MODULES"]
+
+def __getattr__(name):
+    if name == "MinesweeperScene":
+        from .minesweeper import MinesweeperScene
+        return MinesweeperScene
+    raise AttributeError(f"module 'scenes' has no attribute {name!r}")
@@ -13,8 +13,11 @@ Controls
 
 from __future__ import annotations
 import random, pygame
+import numpy as np
 from typing import Dict, List, Tuple
 from boards.grid_board import GridBoard
+from core.asset_manager import load_scaled
+from core.jit          import njit, HAVE_NUMBA
 from config            import WIDTH, HEIGHT, PROJECT_ROOT
 from constants         import MENU_BG_COLOR
 from ui.widgets        import Button
@@ -31,6 +34,9 @@ COLORS: Dict[str, Tuple[int,int,int]] = {
     "Z": (255,   0,   0),
 }
 
+# tinted tiles by (cell size, colour) – shared across restarts
+_TINTED: Dict[Tuple[int, Tuple[int,int,int]], pygame.Surface] = {}
+
 # ───────── difficulty & gravity ─────────
 DIFFICULTIES = {
     # start-gravity , accel/sec
@@ -65,7 +71,60 @@ BASE = {
     "T": [(-1,0),(0,-1),(0,0),(0,1)],
     "Z": [(0,-1),(0,0),(1,0),(1,1)],
 }
-ROT = {k: rotations(v) for k,v in BASE.items()}
+# per type → orientation → contiguous (4,2) int8 array of (dr,dc) rows
+ROT: Dict[str, List[np.ndarray]] = {
+    k: [np.asarray(cells, dtype=np.int8) for cells in rotations(v)]
+    for k,v in BASE.items()
+}
+
+PIECE_TYPES = tuple(BASE)              # ("I","J","L","O","S","T","Z")
+
+# board cells hold uint8 ids: 0 = empty, 1..7 = piece type
+TILE_NAMES = (None, *PIECE_TYPES)
+TILE_IDS   = {t: i for i, t in enumerate(TILE_NAMES) if t}
+BAG_IDS    = tuple(TILE_IDS[t] for t in PIECE_TYPES)   # one 7-bag, unshuffled
+
+# the same arrays indexed by tile id instead of name
+ROT_ARR = (None, *(tuple(ROT[t]) for t in PIECE_TYPES))
+
+# each row is also kept as a bitmask (bit c = column c filled)
+ROW_BITS = (1 << np.arange(COLS)).astype(np.uint16)
+FULL_ROW = (1 << COLS) - 1
+
+# ───────── collision kernels (numba‑compiled when available) ─────────
+@njit("b1(u1[:,:], i1[:,:], i8, i8)", cache=True)
+def _fits(cells, offs, row, col):
+    rows, cols = cells.shape
+    for i in range(offs.shape[0]):
+        r = row + offs[i, 0]
+        c = col + offs[i, 1]
+        if c < 0 or c >= cols or r >= rows:
+            return False
+        if r >= 0 and cells[r, c] != 0:
+            return False
+    return True
+
+@njit("i8(u1[:,:], i1[:,:], i8, i8)", cache=True)
+def _drop_row(cells, offs, row, col):
+    """Lowest row the piece can fall to from *row* (hard‑drop target)."""
+    while _fits(cells, offs, row + 1, col):
+        row += 1
+    return row
+
+if not HAVE_NUMBA:
+    # interpreted fallback: indexing an ndarray per element boxes a NumPy
+    # scalar each time (and so does a vectorised check on 4 cells), so
+    # unpack the offsets once and read cells with .item()
+    def _fits(cells, offs, row, col):   # noqa: F811
+        rows, cols = cells.shape
+        for dr, dc in offs.tolist():
+            r = row + dr
+            c = col + dc
+            if c < 0 or c >= cols or r >= rows:
+                return False
+            if r >= 0 and cells.item(r, c):
+                return False
+        return True
 
 # ───────── scene class ─────────
 class BrickLayerScene:
@@ -78,14 +137,21 @@ class BrickLayerScene:
         self.cs   = min(32, (WIDTH-20)//COLS, (HEIGHT-180)//ROWS)
         origin    = ((WIDTH - COLS*self.cs)//2, 80)
         self.rect = pygame.Rect(*origin, COLS*self.cs, ROWS*self.cs)
-        self.grid = GridBoard(ROWS, COLS, self.cs, origin)
+        self.grid = GridBoard(ROWS, COLS, self.cs, origin, dtype=np.uint8)
+        self.cells = self.grid.grid
+        self.row_mask = np.zeros(ROWS, np.uint16)   # mirrors cells != 0
 
         # tile set
-        tile = pygame.image.load(
-            PROJECT_ROOT / "assets" / "gameparts" / "tile.svg"
-        ).convert_alpha()
-        tile = pygame.transform.smoothscale(tile, (self.cs, self.cs))
-        self.tiles = {n:self._tint(tile,c) for n,c in COLORS.items()}
+        tile = load_scaled(PROJECT_ROOT / "assets" / "gameparts" / "tile.svg", (self.cs, self.cs))
+        self.tiles = {}
+        for n,c in COLORS.items():
+            if (self.cs,c) not in _TINTED: _TINTED[(self.cs,c)] = self._tint(tile,c)
+            self.tiles[n] = _TINTED[(self.cs,c)]
+        self.tiles_by_id = (None, *(self.tiles[t] for t in PIECE_TYPES))  # [0] = empty
+
+        # settled blocks: patched on lock, rebuilt after line clears / reset
+        self._board_surf  = pygame.Surface((COLS*self.cs, ROWS*self.cs), pygame.SRCALPHA)
+        self._board_dirty = True
 
         # UI
         mid, y = WIDTH//2, HEIGHT-70
@@ -94,6 +160,12 @@ class BrickLayerScene:
         self.font_big = pygame.font.Font(None,36)
         self.font_sml = pygame.font.Font(None,24)
 
+        # the only regions that change during play; None → flip everything
+        hud = pygame.Rect(self.rect.right+20, self.rect.top, WIDTH-self.rect.right-20, 56)
+        self._dirty = [self.rect, hud, self.btn_menu.rect]
+        if sum(r.w*r.h for r in self._dirty) > WIDTH*HEIGHT//2:
+            self._dirty = None      # updating rects only pays off for a small area
+
         self._reset()
 
     # ───── helpers ─────
@@ -103,39 +175,49 @@ class BrickLayerScene:
         mask = pygame.Surface(s.get_size(), pygame.SRCALPHA)
         mask.fill((*rgb,255))
         s.blit(mask,(0,0), special_flags=pygame.BLEND_RGBA_MULT)
-        return s
+        return s.convert_alpha()
 
     def _spawn(self):
-        t = random.choice(list(ROT))
-        self.piece = {"type":t,"o":0,"row":0,"col":COLS//2}
-        if not self._valid(self.piece):
+        # 7-bag: every piece type once per shuffled bag
+        if not self._bag:
+            self._bag = list(BAG_IDS)
+            random.shuffle(self._bag)
+        # active piece: tile id, orientation, row, col
+        self.p_type, self.p_o, self.p_row, self.p_col = self._bag.pop(), 0, 0, COLS//2
+        if not self._valid(self.p_type,self.p_o,self.p_row,self.p_col):
             self.game_over=True
 
     # collision check
-    def _valid(self,p)->bool:
-        for dr,dc in ROT[p["type"]][p["o"]]:
-            r,c=p["row"]+dr, p["col"]+dc
-            if c<0 or c>=COLS or r>=ROWS: return False
-            if r>=0 and self.cells[r][c]: return False
-        return True
+    def _valid(self,t:int,o:int,row:int,col:int)->bool:
+        return _fits(self.cells, ROT_ARR[t][o], row, col)
 
     # lock piece
     def _lock(self):
-        t=self.piece["type"]
-        for dr,dc in ROT[t][self.piece["o"]]:
-            r,c=self.piece["row"]+dr, self.piece["col"]+dc
-            if r>=0: self.cells[r][c]=t
-            else:    self.game_over=True
+        offs=ROT_ARR[self.p_type][self.p_o]
+        rs,cs=offs[:,0]+self.p_row, offs[:,1]+self.p_col
+        vis=rs>=0
+        rs,cs=rs[vis],cs[vis]
+        self.cells[rs,cs]=self.p_type               # scatter the 4 blocks
+        np.bitwise_or.at(self.row_mask,rs,ROW_BITS[cs])
+        if not vis.all(): self.game_over=True       # locked above the top
+        if not self._board_dirty:                   # patch the cached image
+            tile=self.tiles_by_id[self.p_type]
+            self._board_surf.blits([(tile,(c*self.cs,r*self.cs))
+                                    for r,c in zip(rs.tolist(),cs.tolist())],
+                                   doreturn=False)
         self._clear_lines()
         self._spawn()
 
     def _clear_lines(self):
-        filled=[r for r in range(ROWS) if all(self.cells[r])]
-        for r in reversed(filled): del self.cells[r]
-        self.cells[0:0]=[[None]*COLS for _ in filled]
-        if filled:
-            self.lines+=len(filled)
-            self.score+=(len(filled)**2)*100
+        full=np.flatnonzero(self.row_mask==FULL_ROW)
+        k=full.size
+        if k:
+            self.grid.clear_rows(full)
+            kept=np.delete(self.row_mask,full)
+            self.row_mask[:k]=0; self.row_mask[k:]=kept
+            self._board_dirty=True
+            self.lines+=k
+            self.score+=k*k*100
 
     # ───── input ─────
     def handle_event(self,ev):
@@ -161,7 +243,8 @@ class BrickLayerScene:
                     self.soft=True
 
             elif ev.key==pygame.K_SPACE:             # hard-drop
-                while self._fall_one(): pass
+                self.p_row=_drop_row(self.cells,ROT_ARR[self.p_type][self.p_o],
+                                     self.p_row,self.p_col)
                 self._lock()
 
         elif ev.type==pygame.KEYUP and ev.key in (pygame.K_DOWN,pygame.K_s):
@@ -171,15 +254,15 @@ class BrickLayerScene:
 
     # shift / rotate
     def _shift(self,dx:int):
-        nxt={**self.piece,"col":self.piece["col"]+dx}
-        if self._valid(nxt): self.piece=nxt
+        if self._valid(self.p_type,self.p_o,self.p_row,self.p_col+dx):
+            self.p_col+=dx
 
     def _rotate(self,d:int):
-        t=self.piece["type"]; n=len(ROT[t])
-        nxt={**self.piece,"o":(self.piece["o"]+d)%n}
+        t=self.p_type
+        o=(self.p_o+d)%len(ROT_ARR[t])
         for kick in (0,-1,1,-2,2):
-            test={**nxt,"col":nxt["col"]+kick}
-            if self._valid(test): self.piece=test; break
+            if self._valid(t,o,self.p_row,self.p_col+kick):
+                self.p_o=o; self.p_col+=kick; break
 
     # scale timer when toggling soft-drop
     def _scale_timer(self,to_soft:bool):
@@ -190,9 +273,8 @@ class BrickLayerScene:
 
     # fall one row
     def _fall_one(self)->bool:
-        nxt={**self.piece,"row":self.piece["row"]+1}
-        if self._valid(nxt):
-            self.piece=nxt
+        if self._valid(self.p_type,self.p_o,self.p_row+1,self.p_col):
+            self.p_row+=1
             return True
         return False
 
@@ -215,22 +297,33 @@ class BrickLayerScene:
             step=self._cur_step()  # step might shrink as gravity accelerates
 
     # ───── rendering ─────
+    def _redraw_board(self):
+        rs,cs=np.nonzero(self.cells)
+        xs,ys=(cs*self.cs).tolist(),(rs*self.cs).tolist()
+        self._board_surf.fill((0,0,0,0))
+        self._board_surf.blits([(self.tiles_by_id[t],(x,y))
+                                for t,x,y in zip(self.cells[rs,cs].tolist(),xs,ys)],
+                               doreturn=False)
+        self._board_dirty=False
+
     def draw(self):
         self.scr.fill(MENU_BG_COLOR)
         pygame.draw.rect(self.scr,GRID_BG_CLR,self.rect)
         pygame.draw.rect(self.scr,GRID_BORDER_CLR,self.rect,GRID_BORDER_W)
         self.grid.draw(self.scr)
 
-        # settled
-        for r in range(ROWS):
-            for c,t in enumerate(self.cells[r]):
-                if t: self.scr.blit(self.tiles[t],self.grid.cell_to_pixel(r,c))
+        # settled (cached surface)
+        if self._board_dirty:
+            self._redraw_board()
+        self.scr.blit(self._board_surf,self.grid.origin)
 
         # active
-        t=self.piece["type"]
-        for dr,dc in ROT[t][self.piece["o"]]:
-            r,c=self.piece["row"]+dr, self.piece["col"]+dc
-            if r>=0: self.scr.blit(self.tiles[t],self.grid.cell_to_pixel(r,c))
+        t,o,row,col=self.p_type,self.p_o,self.p_row,self.p_col
+        tile=self.tiles_by_id[t]
+        offs=ROT_ARR[t][o]
+        rs=offs[:,0]+row; vis=rs>=0
+        xs,ys=self.grid.cell_to_pixel_array(rs[vis],offs[vis,1]+col)
+        self.scr.blits([(tile,xy) for xy in zip(xs.tolist(),ys.tolist())],doreturn=False)
 
         self.scr.blit(self.font_sml.render(f"Lines: {self.lines}",True,(250,250,250)),
                       (self.rect.right+20,self.rect.top))
@@ -243,13 +336,20 @@ class BrickLayerScene:
             self.btn_restart.draw(self.scr)
         self.btn_menu.draw(self.scr)
 
+        if self.game_over or self._full_redraw:
+            self._full_redraw=False
+            return None
+        return self._dirty
+
     # ───── reset ─────
     def _reset(self):
-        self.cells=[[None]*COLS for _ in range(ROWS)]
+        self.cells.fill(0); self.row_mask.fill(0)
+        self._board_dirty=self._full_redraw=True
         self.lines=self.score=0
         self.elapsed=self.timer=0.0
         self.soft=False
         self.game_over=False
+        self._bag=[]
         self._spawn()
 
 # ───────── loader hook ─────────
@@ -19,6 +19,7 @@ from typing import Dict, List, Set
 import pygame
 
 from boards.word_board import WordBoard
+from core.asset_manager import load_image, load_scaled
 from config            import WIDTH, HEIGHT, PROJECT_ROOT
 from constants         import MENU_BG_COLOR
 from ui.widgets        import Button
@@ -82,14 +83,24 @@ class HangmanScene:
         self.word_f  = pygame.font.Font(None, 78)
         self.hud_f   = pygame.font.Font(None, 32)
 
+        # whole-frame dirty flag + the second the HUD clock last showed
+        self._dirty, self._shown_sec = True, -1
+
+        # labels that only change on a guess, rebuilt lazily in draw()
+        self._text_dirty = True
+        self._word_lbl: pygame.Surface | None = None
+        self._title_lbl: pygame.Surface | None = None
+        self._diff_lbl = self.hud_f.render(self.difficulty, True, (255,255,255))
+        self._diff_pos = self.hud_f.render("x",True,(0,0,0)).get_rect(topright=(WIDTH-10,15))
+
         # gallows frames
         g_dir = PROJECT_ROOT / "assets" / "gameparts" / "gallows"
         self.gallows = []
         for i in range(MAX_MISTAKES + 1):
-            img  = pygame.image.load(g_dir / f"gallows-{i}.svg").convert_alpha()
+            path  = g_dir / f"gallows-{i}.svg"
+            img   = load_image(path)
             scale = 280 / img.get_height()
-            img  = pygame.transform.smoothscale(img, (int(img.get_width()*scale), 280))
-            self.gallows.append(img)
+            self.gallows.append(load_scaled(path, (int(img.get_width()*scale), 280)))
 
         # WordBoard (keyboard only)
         kb_size, kb_gap = 40, 6
@@ -99,6 +110,15 @@ class HangmanScene:
         # reserve 70 px for end-screen buttons + 20 px margin
         self.board.origin = ((WIDTH - kb_w)//2, HEIGHT - kb_h - 90)
 
+        # key feedback: absolute key rect + white label, computed once
+        ox, oy = self.board.origin
+        kb_y   = oy + 30               # keyboard block top inside WordBoard
+        self._kb_feedback: Dict[str, tuple[pygame.Rect, pygame.Surface, pygame.Rect]] = {}
+        for ch, r in self.board._keyboard_rects.items():
+            rect = r.inflate(-4,-4).move(ox, kb_y)
+            lbl  = self.board.font.render(ch, True, (255,255,255))
+            self._kb_feedback[ch] = (rect, lbl, lbl.get_rect(center=rect.center))
+
         # per-letter key colours
         self.key_colours: Dict[str, tuple[int,int,int]] = {}
 
@@ -140,12 +160,14 @@ class HangmanScene:
             self.key_colours[ch] = MISS_CLR
             self.mistakes += 1
             if self.mistakes >= MAX_MISTAKES: self.game_over = True
+        self._text_dirty = True
         self._build_buttons()
 
     def _reset(self): self.__init__(self.screen, self.difficulty)
 
     # ───────── event loop ─────────
     def handle_event(self, ev: pygame.event.Event):
+        self._dirty = True
         if self.game_over:
             if ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
                 if self.restart_btn and self.restart_btn.hovered(ev.pos): self._reset(); return
@@ -167,7 +189,10 @@ class HangmanScene:
             self.elapsed = time.time() - self.start_time
 
     # ───────── draw helpers ─────────
-    def _draw_word(self):
+    def _render_text(self):
+        """Re-render the title and hinted word (both only change on a guess)."""
+        title = ("You Win!" if self.win else "You Lose!") if self.game_over else "Hangman"
+        self._title_lbl = self.title_f.render(title, True, (255,255,255))
         chars = []
         for i, ch in enumerate(self.word):
             if ch == " ":
@@ -176,29 +201,33 @@ class HangmanScene:
                 chars.append(ch)
             else:
                 chars.append("_")
-        label = self.word_f.render(" ".join(chars), True, (255,255,255))
+        self._word_lbl = self.word_f.render(" ".join(chars), True, (255,255,255))
+        self._text_dirty = False
+
+    def _draw_word(self):
+        label = self._word_lbl
         self.screen.blit(label, label.get_rect(midtop=(WIDTH//2, 60)))
 
     def _draw_keyboard_feedback(self):
-        if not self.key_colours: return
-        ox, oy = self.board.origin
-        kb_y   = oy + 30               # keyboard block top inside WordBoard
         for ch, colour in self.key_colours.items():
-            rect = self.board._keyboard_rects[ch].inflate(-4,-4).move(ox, kb_y)
+            rect, lbl, lbl_rect = self._kb_feedback[ch]
             pygame.draw.rect(self.screen, colour, rect, border_radius=6)
-            lbl = self.board.font.render(ch, True, (255,255,255))
-            self.screen.blit(lbl, lbl.get_rect(center=rect.center))
+            self.screen.blit(lbl, lbl_rect)
 
     # ───────── main draw ─────────
     def draw(self):
+        # the frame only changes on input or when the clock ticks over a second
+        if not self._dirty and int(self.elapsed) == self._shown_sec:
+            return []                   # screen still holds the last frame
+        self._dirty, self._shown_sec = False, int(self.elapsed)
         self.screen.fill(MENU_BG_COLOR)
+        if self._text_dirty:
+            self._render_text()
 
-        title = ("You Win!" if self.win else "You Lose!") if self.game_over else "Hangman"
-        t_lbl = self.title_f.render(title, True, (255,255,255))
+        t_lbl = self._title_lbl
         self.screen.blit(t_lbl, t_lbl.get_rect(midtop=(WIDTH//2, 10)))
 
-        self.screen.blit(self.hud_f.render(self.difficulty, True, (255,255,255)),
-                         self.hud_f.render("x",True,(0,0,0)).get_rect(topright=(WIDTH-10,15)))
+        self.screen.blit(self._diff_lbl, self._diff_pos)
         self.screen.blit(self.hud_f.render(f"{int(self.elapsed):03d}s",True,(255,255,255)), (10,15))
 
         self.screen.blit(self.gallows[min(self.mistakes, MAX_MISTAKES)],
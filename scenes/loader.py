@@ -1,17 +1,19 @@
 # scenes/loader.py
 
-import pkgutil
 import importlib
 
+from scenes import SCENE_MODULES
+
 def register_all(registry):
     """
-    Dynamically import every module in `scenes/` (except this one)
-    and call its `register(registry)` function if present.
+    Hook every module listed in `scenes.SCENE_MODULES` up to the registry.
+    Modules named after a game that already has a cover are registered
+    lazily – they are only imported once that game is picked.  Anything
+    else is imported now and its `register(registry)` called.
     """
-    import scenes  # your package
-    for _, modname, _ in pkgutil.iter_modules(scenes.__path__):
-        if modname == "loader":
+    known = {name.lower(): name for name in registry.all_games()}
+    for modname in SCENE_MODULES:
+        if modname in known:
+            registry.register_lazy(known[modname], f"scenes.{modname}")
             continue
-        module = importlib.import_module(f"scenes.{modname}")
-        if hasattr(module, "register"):
-            module.register(registry)
+        importlib.import_module(f"scenes.{modname}").register(registry)
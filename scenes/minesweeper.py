@@ -1,8 +1,11 @@
 # scenes/minesweeper.py
 from __future__ import annotations
-import pygame, random, time
+import pygame, time
+import numpy as np
 
 from boards.grid_board import GridBoard
+from core.asset_manager import load_scaled
+from core.jit          import njit
 from config            import PROJECT_ROOT, WIDTH, HEIGHT
 from constants         import MENU_BG_COLOR
 from ui.widgets        import Button
@@ -23,6 +26,34 @@ NUM_COLOURS = {
 LIGHT_GRID_BG = (150,150,150)
 LOSS_BG       = (255,180,180)   # light red tint under mines on loss
 
+# ───── flood fill (numba‑compiled when available) ──────────────────
+@njit("i8(b1[:,:], b1[:,:], u1[:,:], i8, i8)", cache=True)
+def _flood_fill(rev, flag, adj, r0, c0):
+    """
+    Reveal (r0,c0) and, through zero cells, everything connected to it.
+    Returns the number of cells newly revealed.
+    """
+    rows, cols = rev.shape
+    if rev[r0, c0] or flag[r0, c0]:
+        return 0
+    # cells are marked revealed when pushed, so the stack never overflows
+    stack = np.empty((rows*cols, 2), np.int64)
+    stack[0, 0] = r0; stack[0, 1] = c0; sp = 1
+    rev[r0, c0] = True
+    n = 1
+    while sp:
+        sp -= 1
+        r = stack[sp, 0]; c = stack[sp, 1]
+        if adj[r, c] != 0:
+            continue
+        for nr in range(max(r-1, 0), min(r+2, rows)):
+            for nc in range(max(c-1, 0), min(c+2, cols)):
+                if not rev[nr, nc] and not flag[nr, nc]:
+                    rev[nr, nc] = True
+                    stack[sp, 0] = nr; stack[sp, 1] = nc; sp += 1
+                    n += 1
+    return n
+
 class MinesweeperScene:
     def __init__(self, screen: pygame.Surface,
                  rows:int, cols:int, mine_count:int,
@@ -33,12 +64,14 @@ class MinesweeperScene:
         # scale cell‑size
         self.cs=min(32,(WIDTH-20)//self.cols,(HEIGHT-180)//self.rows)
         origin=((WIDTH-self.cols*self.cs)//2,80)
-        self.board=GridBoard(rows,cols,self.cs,origin)
+        self.board=GridBoard(rows,cols,self.cs,origin,skip_cells=True)
+        # hit-test geometry, inlined in handle_event
+        self._ox,self._oy=origin
+        self._bw,self._bh=cols*self.cs,rows*self.cs
 
         # assets
         part=PROJECT_ROOT/'assets'/'gameparts'
-        def load(svg): return pygame.transform.smoothscale(
-            pygame.image.load(part/svg).convert_alpha(),(self.cs,self.cs))
+        def load(svg): return load_scaled(part/svg,(self.cs,self.cs))
         self.tile_img=load('tile.svg')
         self.flag_img=load('flag.svg')
         self.mine_img=load('mine.svg')
@@ -48,6 +81,14 @@ class MinesweeperScene:
         self.title_font=pygame.font.Font(None,48)
         self.hud_font  =pygame.font.Font(None,32)
 
+        # adj 1..8 → pre-rendered label, centred in a cell at (0,0)
+        self._digit_imgs={n:self.num_font.render(str(n),True,NUM_COLOURS[n]) for n in range(1,9)}
+        self._digit_rects={n:img.get_rect(center=(self.cs//2,self.cs//2))
+                           for n,img in self._digit_imgs.items()}
+
+        self._grid_bg=self._build_grid_bg()
+        self._dirty=True; self._shown_sec=-1
+
         self._reset_board()
         self.start_time:float|None=None; self.elapsed=0.0
         self.game_over=self.win=False
@@ -58,44 +99,48 @@ class MinesweeperScene:
     def _reset_board(self):
         self.first_click=True; self.game_over=self.win=False
         self.elapsed=0.0; self.start_time=None; self.exploded=None
-        self.cells=[[{"mine":False,"adj":0,"rev":False,"flag":False}
-                     for _ in range(self.cols)] for _ in range(self.rows)]
+        # per-cell state as parallel (rows, cols) arrays
+        shape=(self.rows,self.cols)
+        self.mine=np.zeros(shape,bool);  self.adj =np.zeros(shape,np.uint8)
+        self.rev =np.zeros(shape,bool);  self.flag=np.zeros(shape,bool)
+        self._n_rev=self._n_flags=0     # running rev/flag counts for the HUD
 
     def _place_mines(self,sr,sc):
-        forbidden={(sr+dr,sc+dc)
-                   for dr in(-1,0,1) for dc in(-1,0,1)
-                   if 0<=sr+dr<self.rows and 0<=sc+dc<self.cols}
-        pool=[(r,c) for r in range(self.rows) for c in range(self.cols)
-              if (r,c) not in forbidden]
-        for r,c in random.sample(pool,self.mine_count):
-            self.cells[r][c]["mine"]=True
-        for r in range(self.rows):
-            for c in range(self.cols):
-                if self.cells[r][c]["mine"]:continue
-                self.cells[r][c]["adj"]=sum(
-                    self.cells[r+dr][c+dc]["mine"]
-                    for dr in(-1,0,1) for dc in(-1,0,1)
-                    if 0<=r+dr<self.rows and 0<=c+dc<self.cols)
-
-    def _pixel_to_cell(self,pos): return self.board.pixel_to_cell(*pos)
-
-    def _flood(self,r0,c0):
-        stack=[(r0,c0)]
-        while stack:
-            r,c=stack.pop()
-            cd=self.cells[r][c]
-            if cd["rev"]or cd["flag"]:continue
-            cd["rev"]=True
-            if cd["adj"]==0:
-                for dr in(-1,0,1):
-                    for dc in(-1,0,1):
-                        nr,nc=r+dr,c+dc
-                        if 0<=nr<self.rows and 0<=nc<self.cols:
-                            stack.append((nr,nc))
+        # no mines in the 3×3 block around the first click
+        forbidden=np.zeros((self.rows,self.cols),bool)
+        forbidden[max(sr-1,0):sr+2,max(sc-1,0):sc+2]=True
+        pool=np.flatnonzero(~forbidden)
+        self.mine.flat[np.random.choice(pool,self.mine_count,replace=False)]=True
+        # neighbour counts = sum of the 8 shifted copies of the padded mask
+        m=np.pad(self.mine,1).astype(np.uint8)
+        adj=(m[:-2,:-2]+m[:-2,1:-1]+m[:-2,2:]+
+             m[1:-1,:-2]           +m[1:-1,2:]+
+             m[2:,:-2] +m[2:,1:-1] +m[2:,2:])
+        adj[self.mine]=0
+        self.adj=adj
+
+    def _build_grid_bg(self)->pygame.Surface:
+        # static bg + border + lines; one px wider/taller because the
+        # lines' end points land just past the board
+        w,h=self.cols*self.cs,self.rows*self.cs
+        surf=pygame.Surface((w+1,h+1),pygame.SRCALPHA)
+        pygame.draw.rect(surf,LIGHT_GRID_BG,(0,0,w,h))
+        pygame.draw.rect(surf,(90,90,90),(0,0,w,h),3)
+        for r in range(1,self.rows):
+            pygame.draw.line(surf,(200,200,200),(0,r*self.cs),(w,r*self.cs))
+        for c in range(1,self.cols):
+            pygame.draw.line(surf,(200,200,200),(c*self.cs,0),(c*self.cs,h))
+        return surf.convert_alpha()
+
+    def _cells_xy(self,mask)->list[tuple[int,int]]:
+        """Pixel top-left of every cell set in *mask*, row-major."""
+        xs,ys=self.board.cell_to_pixel_array(*np.nonzero(mask))
+        return list(zip(xs.tolist(),ys.tolist()))
+
+    def _flood(self,r0,c0): self._n_rev+=_flood_fill(self.rev,self.flag,self.adj,r0,c0)
 
     def _check_win(self):
-        rev=sum(cd["rev"] for row in self.cells for cd in row)
-        if rev==self.rows*self.cols-self.mine_count:
+        if self._n_rev==self.rows*self.cols-self.mine_count:
             self.win=self.game_over=True; self._build_buttons()
 
     def _build_buttons(self):
@@ -110,6 +155,7 @@ class MinesweeperScene:
 
     # ───────── event handling ──────────────────────────────────────
     def handle_event(self,ev:pygame.event.Event):
+        self._dirty=True
         if self.game_over:
             if ev.type==pygame.MOUSEBUTTONDOWN and ev.button==1:
                 if self.restart_btn and self.restart_btn.hovered(ev.pos): self._reset_board(); return
@@ -120,20 +166,21 @@ class MinesweeperScene:
         if ev.type==pygame.KEYDOWN and ev.key==pygame.K_ESCAPE: return "menu"
 
         if ev.type==pygame.MOUSEBUTTONDOWN and ev.button in(1,3):
-            cell=self._pixel_to_cell(ev.pos)
-            if not cell:return
-            r,c=cell; cd=self.cells[r][c]
+            dx=ev.pos[0]-self._ox; dy=ev.pos[1]-self._oy
+            if not(0<=dx<self._bw and 0<=dy<self._bh):return
+            r,c=dy//self.cs,dx//self.cs
 
-            if ev.button==3 and not cd["rev"]:
-                cd["flag"]=not cd["flag"]; return
+            if ev.button==3 and not self.rev[r,c]:
+                self.flag[r,c]=not self.flag[r,c]
+                self._n_flags+=1 if self.flag[r,c] else -1; return
 
-            if ev.button==1 and not cd["flag"]:
+            if ev.button==1 and not self.flag[r,c]:
                 if self.first_click:
                     self.first_click=False
                     self._place_mines(r,c)
                     self.start_time=time.time()
-                if cd["mine"]:
-                    cd["rev"]=True; self.exploded=(r,c)
+                if self.mine[r,c]:
+                    self.rev[r,c]=True; self._n_rev+=1; self.exploded=(r,c)
                     self.game_over=True; self.win=False
                     self._build_buttons()
                 else:
@@ -145,6 +192,10 @@ class MinesweeperScene:
             self.elapsed=time.time()-self.start_time
 
     def draw(self):
+        # the frame only changes on input or when the clock ticks over a second
+        if not self._dirty and int(self.elapsed)==self._shown_sec:
+            return []                   # screen still holds the last frame
+        self._dirty=False; self._shown_sec=int(self.elapsed)
         self.screen.fill(MENU_BG_COLOR)
         # Title
         title="You Win!" if self.win else "You Lose!" if self.game_over else "Minesweeper"
@@ -156,47 +207,30 @@ class MinesweeperScene:
         d_lbl=self.hud_font.render(self.difficulty,True,(255,255,255))
         self.screen.blit(d_lbl,d_lbl.get_rect(topright=(WIDTH-10,15)))
 
-        # grid bg
-        pygame.draw.rect(self.screen,LIGHT_GRID_BG,
-                         (*self.board.origin,self.cols*self.cs,self.rows*self.cs))
-        pygame.draw.rect(self.screen,(90,90,90),
-                         (*self.board.origin,self.cols*self.cs,self.rows*self.cs),3)
-        for r in range(1,self.rows):
-            y=self.board.origin[1]+r*self.cs
-            pygame.draw.line(self.screen,(200,200,200),
-                             (self.board.origin[0],y),
-                             (self.board.origin[0]+self.cols*self.cs,y))
-        for c in range(1,self.cols):
-            x=self.board.origin[0]+c*self.cs
-            pygame.draw.line(self.screen,(200,200,200),
-                             (x,self.board.origin[1]),
-                             (x,self.board.origin[1]+self.rows*self.cs))
+        # grid bg (cached)
+        self.screen.blit(self._grid_bg,self.board.origin)
 
+        # cells never overlap, so draw layer by layer: one batch per layer
         lost=self.game_over and not self.win
-        for r in range(self.rows):
-            for c in range(self.cols):
-                x,y=self.board.cell_to_pixel(r,c)
-                cd=self.cells[r][c]
-                if not cd["rev"]:
-                    self.screen.blit(self.tile_img,(x,y))
-                # tint lost mines
-                if lost and cd["mine"]:
-                    pygame.draw.rect(self.screen,LOSS_BG,(x,y,self.cs,self.cs))
-                if cd["mine"] and (cd["rev"] or lost):
-                    self.screen.blit(self.mine_img,(x,y))
-                elif cd["rev"] and cd["adj"]>0 and not cd["mine"]:
-                    col=NUM_COLOURS.get(cd["adj"],(255,255,255))
-                    n_lbl=self.num_font.render(str(cd["adj"]),True,col)
-                    self.screen.blit(n_lbl,n_lbl.get_rect(center=(x+self.cs//2,y+self.cs//2)))
-                if cd["flag"]:
-                    self.screen.blit(self.flag_img,(x,y))
+        scr,cs=self.screen,self.cs
+        shown=self.mine&(self.rev|lost)
+        nums=self.rev&~self.mine&(self.adj>0)
+        scr.blits([(self.tile_img,xy) for xy in self._cells_xy(~self.rev)],doreturn=False)
+        if lost:
+            for x,y in self._cells_xy(self.mine):
+                pygame.draw.rect(scr,LOSS_BG,(x,y,cs,cs))
+        scr.blits([(self.mine_img,xy) for xy in self._cells_xy(shown)],doreturn=False)
+        imgs,rects=self._digit_imgs,self._digit_rects
+        scr.blits([(imgs[n],rects[n].move(x,y))
+                   for (x,y),n in zip(self._cells_xy(nums),self.adj[nums].tolist())],
+                  doreturn=False)
+        scr.blits([(self.flag_img,xy) for xy in self._cells_xy(self.flag)],doreturn=False)
 
         # HUD bottom
-        flags=sum(cd["flag"] for row in self.cells for cd in row)
+        flags=self._n_flags
         f_lbl=self.hud_font.render(f"Mines Flagged: {flags}/{self.mine_count}",True,(255,255,255))
         self.screen.blit(f_lbl,(10,HEIGHT-40))
-        rev=sum(cd["rev"] for row in self.cells for cd in row)
-        prog=int(100*rev/(self.rows*self.cols-self.mine_count))
+        prog=int(100*self._n_rev/(self.rows*self.cols-self.mine_count))
         p_lbl=self.hud_font.render(f"Progress: {prog:3d}%",True,(255,255,255))
         self.screen.blit(p_lbl,p_lbl.get_rect(bottomright=(WIDTH-10,HEIGHT-10)))
 
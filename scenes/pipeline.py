@@ -2,15 +2,17 @@
 from __future__ import annotations
 
 import io
-import os
 import random
 from typing import Dict, List, Tuple, Optional
 
+import numpy as np
 import pygame
 
 from boards.grid_board import GridBoard
-from config            import WIDTH, HEIGHT
+from config            import WIDTH, HEIGHT, PROJECT_ROOT, REPAINT_EVENTS
 from constants         import MENU_BG_COLOR
+from core.asset_manager import load_scaled
+from core.jit          import njit, HAVE_NUMBA
 
 
 # ──────────────────────────── constants ────────────────────────────
@@ -36,7 +38,153 @@ CHEAT: List[Tuple[int, int, int]] = [
     for r, g, b in PALETTE
 ]
 
-GAMEPARTS_DIR = os.path.join("assets", "gameparts")
+GAMEPARTS_DIR = PROJECT_ROOT / "assets" / "gameparts"
+_CAIRO_CACHE: Dict[Tuple[str, int], pygame.Surface] = {}   # cairosvg renders, per (file, px)
+
+# directions as bit indices 0..3 = U D L R, so the opposite of d is d ^ 1
+DIR_BITS: Dict[str, int] = {"U": 1, "D": 2, "L": 4, "R": 8}
+DELTA_DIR = ((-1, 0, -1),          # [dr + 1][dc + 1] → direction index
+             ( 2, -1, 3),
+             (-1, 1, -1))
+CAP_ROT       = (180, 0, 270, 90)  # cap facing its one neighbour, by direction
+NODE_OPEN_ROT = (0, 180, 90, 270)  # open node facing its path, by direction
+
+
+def _mask_sprite(mask: int) -> Tuple[str, int]:
+    """
+    Sprite for a pipe cell whose path neighbours are the directions in
+    *mask* (never more than two with valid paths).
+
+    Returns (key, rotation_degrees).
+    """
+    dirs = frozenset(d for d, bit in DIR_BITS.items() if mask & bit)
+    if not dirs:
+        return "straight", 0  # should never happen
+
+    # endpoint (one neighbour)
+    if len(dirs) == 1:
+        return "cap", CAP_ROT[mask.bit_length() - 1]
+
+    # two neighbours -------------------------------------------------
+    if dirs == {"U", "D"}:
+        return "straight", 0
+    if dirs == {"L", "R"}:
+        return "straight", 90
+
+    elbow_map = {
+        frozenset({"D", "R"}): 0,
+        frozenset({"R", "U"}): 90,
+        frozenset({"U", "L"}): 180,
+        frozenset({"L", "D"}): 270,
+    }
+    if dirs in elbow_map:
+        return "elbow", elbow_map[dirs]
+
+    # fallback (should not occur with valid paths)
+    return "straight", 90
+
+
+def _mask_node_rot(mask: int) -> int:
+    """Open‑node rotation: faces the first of D, L, R, U present in *mask*."""
+    for d in (1, 2, 3, 0):
+        if mask >> d & 1:
+            return NODE_OPEN_ROT[d]
+    return 0
+
+
+PIPE_SPRITE_TABLE: Tuple[Tuple[str, int], ...] = tuple(_mask_sprite(m) for m in range(16))
+NODE_ROT_TABLE:    Tuple[int, ...]             = tuple(_mask_node_rot(m) for m in range(16))
+# every (key, rot) the board can show; only these get pre‑rotated sprites
+SPRITE_VARIANTS: Tuple[Tuple[str, int], ...] = tuple(sorted(
+    set(PIPE_SPRITE_TABLE)
+    | {("node_open", rot) for rot in NODE_ROT_TABLE}
+    | {("node_closed", 0)}))
+
+
+# ──────────────────── segment walk (numba‑compiled when available) ────────────────────
+@njit("i2[:,:](i8, i8, i8[:], i8)", cache=True)
+def _walk_segments(rows, cols, lengths, seed):
+    """
+    Lay one random self‑avoiding walk per entry of *lengths*, in order.
+    Returns the (r, c) cells of all segments back to back, or an empty
+    array if some segment could not be placed within 200 attempts.
+    """
+    np.random.seed(seed)
+    total = rows * cols
+    used  = np.zeros(total, np.bool_)
+    path  = np.empty(total, np.int32)
+    opts  = np.empty(4, np.int32)
+    out   = np.empty((lengths.sum(), 2), np.int16)
+    k = 0
+    for L in lengths:
+        placed = False
+        for _ in range(200):
+            start = np.random.randint(0, total)
+            if used[start]:
+                continue
+            used[start] = True
+            path[0] = start; n = 1
+            while n < L:
+                cur = path[n - 1]
+                r = cur // cols; c = cur - r * cols
+                m = 0                                   # D U R L
+                if r < rows - 1 and not used[cur + cols]: opts[m] = cur + cols; m += 1
+                if r > 0        and not used[cur - cols]: opts[m] = cur - cols; m += 1
+                if c < cols - 1 and not used[cur + 1]:    opts[m] = cur + 1;    m += 1
+                if c > 0        and not used[cur - 1]:    opts[m] = cur - 1;    m += 1
+                if m == 0:
+                    break
+                nxt = opts[np.random.randint(0, m)]
+                used[nxt] = True
+                path[n] = nxt; n += 1
+            if n == L:
+                for i in range(L):
+                    out[k + i, 0] = path[i] // cols
+                    out[k + i, 1] = path[i] % cols
+                k += L
+                placed = True
+                break
+            for i in range(n):                          # undo the dead end
+                used[path[i]] = False
+        if not placed:
+            return np.empty((0, 2), np.int16)
+    return out
+
+if not HAVE_NUMBA:
+    # interpreted fallback: per‑element ndarray access boxes a NumPy scalar
+    # every time, which makes the walk slower than plain lists, so redo it
+    # with lists and a private random.Random seeded the same way
+    def _walk_segments(rows, cols, lengths, seed):   # noqa: F811
+        rng   = random.Random(seed)
+        total = rows * cols
+        used  = [False] * total
+        out: List[Tuple[int, int]] = []
+        for L in lengths.tolist():
+            for _ in range(200):
+                start = rng.randrange(total)
+                if used[start]:
+                    continue
+                used[start] = True
+                path = [start]
+                while len(path) < L:
+                    cur = path[-1]
+                    r, c = divmod(cur, cols)
+                    opts = [n for n, ok in ((cur + cols, r < rows - 1), (cur - cols, r > 0),
+                                            (cur + 1, c < cols - 1), (cur - 1, c > 0))
+                            if ok and not used[n]]
+                    if not opts:
+                        break
+                    nxt = rng.choice(opts)
+                    used[nxt] = True
+                    path.append(nxt)
+                if len(path) == L:
+                    out.extend(divmod(i, cols) for i in path)
+                    break
+                for i in path:
+                    used[i] = False
+            else:
+                return np.empty((0, 2), np.int16)
+        return np.array(out, np.int16)
 
 
 # ──────────────────────────── helpers ────────────────────────────
@@ -50,8 +198,7 @@ class Cell:
 
 # ──────────────────────────── scene ────────────────────────────
 class PipelineScene:
-    DIRS        = [(1, 0), (-1, 0), (0, 1), (0, -1)]        # D U R L
-    DIR_LABELS  = ["D", "U", "R", "L"]
+    wants_motion = True                                    # pipe dragging
 
     # ───────── init ─────────
     def __init__(self, screen: pygame.Surface,
@@ -89,19 +236,24 @@ class PipelineScene:
 
     # ───────── graphics ─────────
     def _load_svg(self, fname: str) -> pygame.Surface:
-        path = os.path.join(GAMEPARTS_DIR, fname)
+        # shared per (path, size) across scenes, like every other game part
+        path = GAMEPARTS_DIR / fname
+        size = (self.cell_px, self.cell_px)
         try:
-            surf = pygame.image.load(path).convert_alpha()
+            return load_scaled(path, size)
         except pygame.error:
+            pass
+        key = (fname, self.cell_px)
+        if key not in _CAIRO_CACHE:
             import cairosvg  # type: ignore
-            with open(path, "rb") as f:
-                png = cairosvg.svg2png(
-                    bytestring=f.read(),
-                    output_width=self.cell_px,
-                    output_height=self.cell_px,
-                )
+            png = cairosvg.svg2png(
+                bytestring=path.read_bytes(),
+                output_width=self.cell_px,
+                output_height=self.cell_px,
+            )
             surf = pygame.image.load(io.BytesIO(png)).convert_alpha()
-        return pygame.transform.smoothscale(surf, (self.cell_px, self.cell_px))
+            _CAIRO_CACHE[key] = pygame.transform.smoothscale(surf, size)
+        return _CAIRO_CACHE[key]
 
     def _load_assets(self) -> None:
         self.pipe_svg = {
@@ -118,20 +270,28 @@ class PipelineScene:
             "node_closed" : self._load_svg("flow-node-closed.svg"),
             "node_open"   : self._load_svg("flow-node-open.svg"),
         }
-        self._tint_cache: Dict[Tuple[str, int], pygame.Surface] = {}
-
-    def _tinted_flow(self, key: str, col: int) -> pygame.Surface:
-        ck = (key, col)
-        if ck in self._tint_cache:
-            return self._tint_cache[ck]
-        base   = self.flow_svg[key]
-        tinted = pygame.Surface(base.get_size(), pygame.SRCALPHA)
-        tinted.fill(PALETTE[col])
-        mask = base.copy()
-        mask.fill((255, 255, 255, 0), special_flags=pygame.BLEND_RGBA_ADD)
-        tinted.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-        self._tint_cache[ck] = tinted
-        return tinted
+        # pipe outlines pre-rotated once: (key, rot) → Surface
+        self.pipe_rot: Dict[Tuple[str, int], pygame.Surface] = {
+            (key, rot): pygame.transform.rotate(self.pipe_svg[key], rot)
+            for key, rot in SPRITE_VARIANTS
+        }
+        # flow fills tinted for every pair colour up front, so a colour's
+        # first drag never stalls a frame: whiten each glyph once, then
+        # one multiply per colour
+        self._tint_cache: Dict[Tuple[str, int, int], pygame.Surface] = {}
+        for key, base in self.flow_svg.items():
+            white = base.copy()
+            white.fill((255, 255, 255, 0), special_flags=pygame.BLEND_RGBA_ADD)
+            rots = [rot for k, rot in SPRITE_VARIANTS if k == key]
+            for col in range(self.pair_n):
+                tinted = white.copy()
+                tinted.fill(PALETTE[col] + (255,), special_flags=pygame.BLEND_RGBA_MULT)
+                for rot in rots:
+                    self._tint_cache[(key, col, rot)] = (
+                        pygame.transform.rotate(tinted, rot) if rot else tinted)
+
+    def _tinted_flow(self, key: str, col: int, rot: int = 0) -> pygame.Surface:
+        return self._tint_cache[(key, col, rot)]
 
     # ───────── state helpers ─────────
     def _init_state(self) -> None:
@@ -142,14 +302,11 @@ class PipelineScene:
         self.active_col: Optional[int]                    = None
         self.active_path: List[Tuple[int, int]]           = []
         self.dragging = self.win = False
-
-    def _neighbors(self, rc: Tuple[int, int]) -> List[Tuple[int, int]]:
-        r, c = rc
-        return [
-            (r + dr, c + dc)
-            for dr, dc in self.DIRS
-            if 0 <= r + dr < self.rows and 0 <= c + dc < self.cols
-        ]
+        # cached backdrop (see _static_layer)
+        self._static_bg: Optional[pygame.Surface] = None
+        self._static_open: frozenset = frozenset()
+        # redraw only on path changes or when the cheat overlay toggles
+        self._dirty, self._cheat_on = True, False
 
     # ───────── board generation ─────────
     def _generate_board(self) -> None:
@@ -168,34 +325,16 @@ class PipelineScene:
                 lengths.append(L)
                 rem -= L
 
-            used: set[Tuple[int, int]] = set()
-            segments: List[List[Tuple[int, int]]] = []
-            failed = False
-
-            for L in lengths:
-                for _ in range(200):
-                    start = random.randrange(self.rows), random.randrange(self.cols)
-                    if start in used:
-                        continue
-                    path = [start]
-                    while len(path) < L:
-                        opts = [n for n in self._neighbors(path[-1])
-                                if n not in used and n not in path]
-                        if not opts:
-                            break
-                        path.append(random.choice(opts))
-                    if len(path) == L:
-                        used.update(path)
-                        segments.append(path)
-                        break
-                else:
-                    failed = True
-                    break
-            if not failed:
+            cells = _walk_segments(self.rows, self.cols,
+                                   np.array(lengths, np.int64),
+                                   random.getrandbits(31))
+            if len(cells):
                 break
 
         # register
-        for col, seg in enumerate(segments):
+        bounds = np.cumsum(lengths)[:-1]
+        for col, part in enumerate(np.split(cells, bounds)):
+            seg = [(r, c) for r, c in part.tolist()]
             self.solution[col] = seg
             for r, c in (seg[0], seg[-1]):
                 tile = self.board.grid[r][c]
@@ -205,29 +344,41 @@ class PipelineScene:
 
     # ───────── input ─────────
     def handle_event(self, ev: pygame.event.Event):
+        if ev.type in REPAINT_EVENTS:
+            self._dirty = True          # window contents lost: redraw it all
+            return
         if ev.type == pygame.KEYDOWN and ev.key == pygame.K_ESCAPE:
             return "menu"
 
+        # cheat overlay while P is held
+        if ev.type in (pygame.KEYDOWN, pygame.KEYUP) and ev.key == pygame.K_p:
+            self._cheat_on = ev.type == pygame.KEYDOWN
+            self._dirty    = True
+            return
+
         if self.win:
             if ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
                 return "menu"
             return
 
+        grid = self.board.grid
+
         # start drag
         if ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
             cell = self.board.pixel_to_cell(*ev.pos)
             if cell:
                 r, c = cell
-                tile = self.board.grid[r][c]
+                tile = grid[r][c]
                 if tile.type == "node" and tile.color is not None:
                     col: int = tile.color
                     self.active_col  = col
                     self.dragging    = True
                     self.active_path = [(r, c)]
+                    self._dirty      = True
 
                     prev = self.paths_drawn.pop(col, [])
                     for pr, pc in prev:
-                        t = self.board.grid[pr][pc]
+                        t = grid[pr][pc]
                         if t.type == "pipe":
                             t.type, t.color = "empty", None
 
@@ -241,16 +392,17 @@ class PipelineScene:
             if abs(r - lr) + abs(c - lc) != 1:
                 return
 
-            tile = self.board.grid[r][c]
+            tile = grid[r][c]
 
             # backtrack
             if (r, c) in self.active_path:
                 idx = self.active_path.index((r, c))
                 for rr, cc in self.active_path[idx + 1:]:
-                    t = self.board.grid[rr][cc]
+                    t = grid[rr][cc]
                     if t.type == "pipe":
                         t.type, t.color = "empty", None
                 self.active_path = self.active_path[:idx + 1]
+                self._dirty = True
                 return
 
             if tile.type in ("node", "pipe") and tile.color != self.active_col:
@@ -259,10 +411,12 @@ class PipelineScene:
             if tile.type == "empty":
                 tile.type, tile.color = "pipe", self.active_col
             self.active_path.append((r, c))
+            self._dirty = True
 
         # end drag
         elif ev.type == pygame.MOUSEBUTTONUP and ev.button == 1 and self.dragging:
             self.dragging = False
+            self._dirty   = True
             if not self.active_path or self.active_col is None:
                 return
 
@@ -273,7 +427,7 @@ class PipelineScene:
                 self.completed[col]   = True
             else:
                 for rr, cc in self.active_path[1:]:
-                    t = self.board.grid[rr][cc]
+                    t = grid[rr][cc]
                     if t.type == "pipe" and t.color == col:
                         t.type, t.color = "empty", None
 
@@ -284,104 +438,93 @@ class PipelineScene:
 
     # ───────── logic helpers ─────────
     def _all_connected_and_filled(self) -> bool:
-        filled = all(tile.type != "empty"
-                     for row in self.board.grid for tile in row)
-        return all(self.completed.values()) and filled
+        if not all(self.completed.values()):
+            return False
+        return not any(tile.type == "empty" for row in self.board.grid for tile in row)
 
     def _center(self, r: int, c: int) -> Tuple[int, int]:
         x, y = self.board.cell_to_pixel(r, c)
         return x + self.cell_px // 2, y + self.cell_px // 2
 
-    def _blit(self, surf: pygame.Surface, r: int, c: int, rot: int = 0) -> None:
-        img = pygame.transform.rotate(surf, rot)
-        ox, oy = self.board.origin
-        self.screen.blit(img, (ox + c * self.cell_px, oy + r * self.cell_px))
-
-    # ───────── sprite chooser (fixed) ─────────
-    def _pipe_sprite(self, dirs: List[str]) -> Tuple[str, int]:
-        """
-        Decide which sprite to draw based on the exact directions present
-        in the path *segment* (built from the direction-map, so never more
-        than two).
-
-        Returns (key, rotation_degrees).
-        """
-        if not dirs:
-            return "straight", 0  # should never happen
-
-        # endpoint (one neighbour)
-        if len(dirs) == 1:
-            rot = {"D": 0, "R": 90, "U": 180, "L": 270}[dirs[0]]
-            return "cap", rot
-
-        # two neighbours -------------------------------------------------
-        s = frozenset(dirs)
-
-        if s == {"U", "D"}:
-            return "straight", 0
-        if s == {"L", "R"}:
-            return "straight", 90
-
-        elbow_map = {
-            frozenset({"D", "R"}): 0,
-            frozenset({"R", "U"}): 90,
-            frozenset({"U", "L"}): 180,
-            frozenset({"L", "D"}): 270,
-        }
-        if s in elbow_map:
-            return "elbow", elbow_map[s]
-
-        # fallback (should not occur with valid paths)
-        return "straight", 90
-
     # ───────── drawing ─────────
     DEBUG_PIPE_SPRITE = False   # ← set to True to print tracing info
 
-    def _draw_pipes(self) -> None:
-        dir_map = self._build_dir_map()  # build once per frame
-
-        for r in range(self.rows):
-            for c in range(self.cols):
-                tile = self.board.grid[r][c]
-                dirs = sorted(dir_map.get((r, c), []))  # might be []
-
-                # PIPE -------------------------------------------------
-                if tile.type == "pipe":
-                    key, rot = self._pipe_sprite(dirs)
-
-                    if self.DEBUG_PIPE_SPRITE and self.dragging:
-                        print(f"pipe {(r,c)} {dirs} -> {key}@{rot}")
+    def _static_layer(self, open_nodes: frozenset) -> pygame.Surface:
+        """
+        Board backdrop + every *closed* node, as one opaque Surface.
+        Rebuilt only when the set of open (path‑touched) nodes changes.
+        """
+        if open_nodes == self._static_open and self._static_bg is not None:
+            return self._static_bg
+        bg = pygame.Surface(self.board._grid_surf.get_size()).convert(self.screen)
+        bg.fill(MENU_BG_COLOR)
+        bg.blit(self.board._grid_surf, (0, 0))
+        closed = [(c * self.cell_px, r * self.cell_px, col)
+                  for r, c, col in self.nodes if (r, c) not in open_nodes]
+        bg.blits([(self._tinted_flow("node_closed", col), (x, y)) for x, y, col in closed],
+                 doreturn=False)
+        outline = self.pipe_rot[("node_closed", 0)]
+        bg.blits([(outline, (x, y)) for x, y, _ in closed], doreturn=False)
+        self._static_bg, self._static_open = bg, open_nodes
+        return bg
+
+    def _draw_pipes(self, dir_map: Dict[Tuple[int, int], int]) -> None:
+        ox, oy  = self.board.origin
+        grid, cs = self.board.grid, self.cell_px
+        tints, pipes = self._tint_cache, self.pipe_rot
+        # cells don't overlap, so all flows go down first and all pipe
+        # outlines on top – one blits() batch each
+        flow_blits: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        pipe_blits: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+
+        # every pipe lies on a path and closed nodes are static, so only
+        # the cells in dir_map can need drawing
+        for (r, c), mask in dir_map.items():
+            tile = grid[r][c]
+
+            # PIPE -------------------------------------------------
+            if tile.type == "pipe":
+                key, rot = PIPE_SPRITE_TABLE[mask]
+
+                if self.DEBUG_PIPE_SPRITE and self.dragging:
+                    print(f"pipe {(r,c)} {mask:04b} -> {key}@{rot}")
+
+            # NODE ------------------------------------------------
+            elif tile.type == "node":
+                key, rot = "node_open", NODE_ROT_TABLE[mask]
+            else:
+                continue
 
-                    self._blit(self._tinted_flow(key, tile.color), r, c, rot)
-                    self._blit(self.pipe_svg[key], r, c, rot)
+            pos = (ox + c * cs, oy + r * cs)
+            flow_blits.append((tints[(key, tile.color, rot)], pos))
+            pipe_blits.append((pipes[(key, rot)], pos))
 
-                # NODE ------------------------------------------------
-                elif tile.type == "node":
-                    if dirs:
-                        rot = {"U": 0, "L": 90, "D": 180, "R": 270}[dirs[0]]
-                        self._blit(self._tinted_flow("node_open", tile.color), r, c, rot)
-                        self._blit(self.pipe_svg["node_open"], r, c, rot)
-                    else:
-                        self._blit(self._tinted_flow("node_closed", tile.color), r, c)
-                        self._blit(self.pipe_svg["node_closed"], r, c)
+        self.screen.blits(flow_blits, doreturn=False)
+        self.screen.blits(pipe_blits, doreturn=False)
 
     def _draw_cheat(self) -> None:
-        if not pygame.key.get_pressed()[pygame.K_p]:
+        if not self._cheat_on:
             return
         width = max(2, self.cell_px // 4)
         for col, seg in self.solution.items():
             pts = [self._center(r, c) for r, c in seg]
             pygame.draw.lines(self.screen, CHEAT[col], False, pts, width)
 
-    def draw(self) -> None:
+    def draw(self):
+        # a static puzzle: the frame only changes on input
+        if not self._dirty:
+            return []                   # screen still holds the last frame
+        self._dirty = False
         self.screen.fill(MENU_BG_COLOR)
 
         title = "Pipeline – " + self.diff if not self.win else "Perfect! Board filled!"
         lbl = self.title_font.render(title, True, (255, 255, 255))
         self.screen.blit(lbl, lbl.get_rect(midtop=(WIDTH // 2, 10)))
 
-        self.screen.blit(self.board._grid_surf, self.board.origin)
-        self._draw_pipes()
+        dir_map = self._build_dir_map()  # build once per frame
+        open_nodes = frozenset((r, c) for r, c, _ in self.nodes if (r, c) in dir_map)
+        self.screen.blit(self._static_layer(open_nodes), self.board.origin)
+        self._draw_pipes(dir_map)
         self._draw_cheat()
 
         if self.win:
@@ -392,24 +535,18 @@ class PipelineScene:
         pass  # static puzzle
 
     # ───────── path → direction map ─────────
-    def _build_dir_map(self) -> Dict[Tuple[int, int], List[str]]:
+    def _build_dir_map(self) -> Dict[Tuple[int, int], int]:
         """
-        Return { (r,c): [dir, …] } where dir in {'U','D','L','R'} enumerates
-        *actual* predecessor/successor steps for every pipe cell.
+        Return { (r,c): mask } where mask ORs the DIR_BITS of the *actual*
+        predecessor/successor steps of every pipe cell.
         """
-        dir_map: Dict[Tuple[int, int], List[str]] = {}
+        dir_map: Dict[Tuple[int, int], int] = {}
 
         def add(a: Tuple[int, int], b: Tuple[int, int]) -> None:
-            ar, ac = a
-            br, bc = b
-            if ar == br:
-                dir_ = "R" if bc > ac else "L"
-            else:
-                dir_ = "D" if br > ar else "U"
-            dir_map.setdefault(a, []).append(dir_)
+            d = DELTA_DIR[b[0] - a[0] + 1][b[1] - a[1] + 1]
+            dir_map[a] = dir_map.get(a, 0) | 1 << d
             # opposite for the neighbour
-            opp = {"U": "D", "D": "U", "L": "R", "R": "L"}[dir_]
-            dir_map.setdefault(b, []).append(opp)
+            dir_map[b] = dir_map.get(b, 0) | 1 << (d ^ 1)
 
         # committed paths
         for path in self.paths_drawn.values():
@@ -7,12 +7,14 @@ This version fixes the last visual glitch:
 • Head now ends flush against the first body square (no extra length aft)
 """
 from __future__ import annotations
-import random, time
+import heapq, random
 from collections import deque
+from itertools import islice
 from typing import Deque, Dict, List, Tuple
 
 import pygame
 from boards.grid_board import GridBoard
+from core.asset_manager import load_scaled
 from config            import WIDTH, HEIGHT, PROJECT_ROOT
 from constants         import MENU_BG_COLOR
 from ui.widgets        import Button
@@ -28,9 +30,16 @@ HEAD_CLR, BODY_CLR            = (40, 220, 40), (30, 170, 30)
 GRID_BG_CLR, GRID_BORDER_CLR  = (220, 220, 220), (60, 60, 60)
 GRID_BORDER_W                 = 3
 MAX_ITEMS_ON_BOARD            = 15
-POISON_EXTRA_SPAWN            = 3.0
-POISON_LIFETIME_MIN           = 10.0
-POISON_LIFETIME_MAX           = 30.0
+POISON_EXTRA_SPAWN_MS         = 3_000       # all times are pygame ticks (ms)
+POISON_LIFETIME_MIN_MS        = 10_000
+POISON_LIFETIME_MAX_MS        = 30_000
+KEY_DIRS = {                                                  # arrows + WASD → (dr, dc)
+    pygame.K_UP: (-1, 0), pygame.K_w: (-1, 0),
+    pygame.K_DOWN: (1, 0), pygame.K_s: (1, 0),
+    pygame.K_LEFT: (0, -1), pygame.K_a: (0, -1),
+    pygame.K_RIGHT:(0, 1), pygame.K_d: (0, 1),
+}
+SIDE_BIT = {(-1, 0): 1, (1, 0): 2, (0, -1): 4, (0, 1): 8}   # neighbour offset → U D L R bit
 
 
 # ───────────────────────────── scene ───────────────────────────────
@@ -50,13 +59,11 @@ class SnakeScene:
         self.difficulty  = difficulty_name
         self.cs = min(32, (WIDTH - 20) // self.cols, (HEIGHT - 180) // self.rows)
         origin  = ((WIDTH - self.cols * self.cs) // 2, 80)
-        self.board = GridBoard(self.rows, self.cols, self.cs, origin)
+        self.board = GridBoard(self.rows, self.cols, self.cs, origin, skip_cells=True)
 
         # assets
         part = PROJECT_ROOT / "assets" / "gameparts"
-        load = lambda svg: pygame.transform.smoothscale(
-            pygame.image.load(part / svg).convert_alpha(), (self.cs, self.cs)
-        )
+        load = lambda svg: load_scaled(part / svg, (self.cs, self.cs))
         self.apple_img, self.poison_img = load("apple.svg"), load("apple_poison.svg")
 
         # fonts
@@ -68,6 +75,7 @@ class SnakeScene:
         self.th_body = int(self.cs * 0.60)
         self.half_head = self.th_head // 2
         self.half_body = self.th_body // 2
+        self._build_sprites()
 
         self._build_buttons()
         self._reset()
@@ -80,48 +88,67 @@ class SnakeScene:
 
     def _reset(self):
         mid = self.rows // 2
-        self.snake: List[Tuple[int, int]] = [(mid, mid - 2), (mid, mid - 1), (mid, mid)]
+        # tail … head; a deque so the per-tick tail pop is O(1)
+        self.snake: Deque[Tuple[int, int]] = deque([(mid, mid - 2), (mid, mid - 1), (mid, mid)])
+        self._snake_set = set(self.snake)      # O(1) self-collision check
         self.direction      = (0, 1)
         self.next_direction = self.direction
         self.poison_penalty = 1
         self.timer          = 0.0
         self.game_over      = False
-        self.start_time     = time.time()
-        self.elapsed_when_end = 0.0
-
-        self.foods: List[Dict] = []
-        self.spawn_queue: Deque[float] = deque()
+        self.start_ms       = pygame.time.get_ticks()
+        self.elapsed_when_end = 0
+
+        # (r, c) → food; insertion order = age, so the oldest is evicted first
+        self.foods: Dict[Tuple[int, int], Dict] = {}
+        # cells holding neither snake nor food; free_idx[pos] = index in free_list
+        self.free_list: List[Tuple[int, int]] = [
+            (r, c) for r in range(self.rows) for c in range(self.cols)
+            if (r, c) not in self._snake_set]
+        self.free_idx: Dict[Tuple[int, int], int] = {p: i for i, p in enumerate(self.free_list)}
+        self.spawn_queue: Deque[int] = deque()
+        # (despawn_at, pos) per poison; entries for eaten/evicted ones go stale
+        self._poison_heap: List[Tuple[int, Tuple[int, int]]] = []
         self._spawn_food()
 
     # ───────────────────────── grid helpers ────────────────────────
+    def _occupy(self, pos: Tuple[int, int]):
+        """Take *pos* out of the free list (swap with the last entry, pop)."""
+        i    = self.free_idx.pop(pos)
+        last = self.free_list.pop()
+        if last != pos:
+            self.free_list[i]   = last
+            self.free_idx[last] = i
+
+    def _release(self, pos: Tuple[int, int]):
+        self.free_idx[pos] = len(self.free_list)
+        self.free_list.append(pos)
+
     def _cell_origin(self, r: int, c: int) -> Tuple[int, int]:
         return self.board.origin[0] + c * self.cs, self.board.origin[1] + r * self.cs
 
-    def _cell_center(self, r: int, c: int) -> Tuple[int, int]:
-        x, y = self._cell_origin(r, c)
-        return x + self.cs // 2, y + self.cs // 2
-
     # ───────────────────────── spawning ────────────────────────────
     def _spawn_food(self):
         if len(self.foods) >= MAX_ITEMS_ON_BOARD:
-            self.foods.pop(0)
+            oldest = next(iter(self.foods))
+            del self.foods[oldest]
+            self._release(oldest)
 
-        occupied = set(self.snake) | {f["pos"] for f in self.foods}
-        free = [(r, c) for r in range(self.rows) for c in range(self.cols) if (r, c) not in occupied]
-        if not free:
+        if not self.free_list:
             return
 
-        pos       = random.choice(free)
+        pos       = self.free_list[random.randrange(len(self.free_list))]
+        self._occupy(pos)
         is_poison = random.random() >= self.apple_ratio
-        now       = time.time()
-        self.foods.append({
-            "pos": pos,
+        now       = pygame.time.get_ticks()
+        self.foods[pos] = {
             "type": "poison" if is_poison else "apple",
-            "despawn_at": now + random.uniform(POISON_LIFETIME_MIN, POISON_LIFETIME_MAX)
+            "despawn_at": now + random.randint(POISON_LIFETIME_MIN_MS, POISON_LIFETIME_MAX_MS)
                           if is_poison else None,
-        })
+        }
         if is_poison:
-            self.spawn_queue.append(now + POISON_EXTRA_SPAWN)
+            heapq.heappush(self._poison_heap, (self.foods[pos]["despawn_at"], pos))
+            self.spawn_queue.append(now + POISON_EXTRA_SPAWN_MS)
 
     # ───────────────────── movement / rules ────────────────────────
     def _valid_turn(self, new: Tuple[int, int]) -> bool:
@@ -134,28 +161,34 @@ class SnakeScene:
         hr, hc = self.snake[-1]
         nr, nc = hr + self.direction[0], hc + self.direction[1]
 
-        if (not 0 <= nr < self.rows) or (not 0 <= nc < self.cols) or ((nr, nc) in self.snake):
+        if (not 0 <= nr < self.rows) or (not 0 <= nc < self.cols) or ((nr, nc) in self._snake_set):
             self._end_game(); return
 
         self.snake.append((nr, nc))
-        hit = next((f for f in self.foods if f["pos"] == (nr, nc)), None)
+        self._snake_set.add((nr, nc))
+        hit = self.foods.pop((nr, nc), None)   # a food cell was never free
         if hit:
-            self.foods.remove(hit)
             if hit["type"] == "apple":
                 self.poison_penalty = 1
             else:
                 if self.poison_penalty >= len(self.snake):
                     self._end_game(); return
                 for _ in range(self.poison_penalty):
-                    self.snake.pop(0)
+                    self._drop_tail()
                 self.poison_penalty *= 2
             self._spawn_food()
         else:
-            self.snake.pop(0)
+            self._occupy((nr, nc))
+            self._drop_tail()
+
+    def _drop_tail(self):
+        tail = self.snake.popleft()
+        self._snake_set.discard(tail)
+        self._release(tail)
 
     def _end_game(self):
         self.game_over = True
-        self.elapsed_when_end = time.time() - self.start_time
+        self.elapsed_when_end = pygame.time.get_ticks() - self.start_ms
 
     # ───────────────────────── event handling ──────────────────────
     def handle_event(self, ev: pygame.event.Event):
@@ -169,14 +202,9 @@ class SnakeScene:
 
         if ev.type == pygame.KEYDOWN:
             if ev.key == pygame.K_ESCAPE: return "menu"
-            dirs = {
-                pygame.K_UP: (-1, 0), pygame.K_w: (-1, 0),
-                pygame.K_DOWN: (1, 0), pygame.K_s: (1, 0),
-                pygame.K_LEFT: (0, -1), pygame.K_a: (0, -1),
-                pygame.K_RIGHT:(0, 1), pygame.K_d: (0, 1),
-            }
-            if ev.key in dirs and self._valid_turn(dirs[ev.key]):
-                self.next_direction = dirs[ev.key]
+            new = KEY_DIRS.get(ev.key)
+            if new and self._valid_turn(new):
+                self.next_direction = new
 
     # ───────────────────────── update loop ─────────────────────────
     def update(self, dt: float):
@@ -186,91 +214,77 @@ class SnakeScene:
             self.timer -= self.step_time
             self._step()
 
-        now = time.time()
-        self.foods[:] = [f for f in self.foods if not (f["type"] == "poison" and now >= f["despawn_at"])]
+        now = pygame.time.get_ticks()
+        heap = self._poison_heap
+        while heap and heap[0][0] <= now:
+            at, pos = heapq.heappop(heap)
+            f = self.foods.get(pos)
+            if f and f["despawn_at"] == at:      # still that same poison
+                del self.foods[pos]
+                self._release(pos)
         while self.spawn_queue and self.spawn_queue[0] <= now:
             self.spawn_queue.popleft()
             self._spawn_food()
 
     # ───────────────────── drawing helpers ─────────────────────────
-    def _bridge(self, p1: Tuple[int, int], p2: Tuple[int, int],
-                thick: int, colour: Tuple[int, int, int], cut_back=False):
+    def _build_sprites(self):
         """
-        Draws rectangle from p1 to p2.
-        If cut_back is True, the rectangle stops *before* reaching p2's centre
-        by half the HEAD thickness. Used for neck→head join.
+        Every snake piece stays inside its own cell, so pre-draw cell-sized
+        pieces: body squares keyed by the bitmask of joined neighbours, and
+        the head keyed by (neck bit, direction).
         """
-        x1, y1 = p1
-        x2, y2 = p2
-        half   = thick // 2
-        if cut_back:
-            # shorten toward p2 by half_head along the direction vector
-            if x1 == x2:       # vertical
-                y2 -= self.direction[0] * self.half_head
-            else:              # horizontal
-                x2 -= self.direction[1] * self.half_head
-
-        if y1 == y2:  # horizontal
-            y = y1 - half
-            x_start = min(x1, x2) - half
-            width   = abs(x2 - x1) + thick
-            pygame.draw.rect(self.screen, colour, (x_start, y, width, thick))
-        else:         # vertical
-            x = x1 - half
-            y_start = min(y1, y2) - half
-            height  = abs(y2 - y1) + thick
-            pygame.draw.rect(self.screen, colour, (x, y_start, thick, height))
+        cs, c = self.cs, self.cs // 2
+
+        def body(mask: int) -> pygame.Surface:
+            surf = pygame.Surface((cs, cs), pygame.SRCALPHA)
+            lo = c - self.half_body                     # square's near edge
+            th = self.th_body
+            pygame.draw.rect(surf, BODY_CLR, (lo, lo, th, th))
+            if mask & 1: pygame.draw.rect(surf, BODY_CLR, (lo, 0, th, lo))        # up
+            if mask & 2: pygame.draw.rect(surf, BODY_CLR, (lo, lo, th, cs - lo))  # down
+            if mask & 4: pygame.draw.rect(surf, BODY_CLR, (0, lo, lo, th))        # left
+            if mask & 8: pygame.draw.rect(surf, BODY_CLR, (lo, lo, cs - lo, th))  # right
+            return surf
+
+        self._body_sprites = [body(m) for m in range(16)]
+        self._head_sprites: Dict[Tuple[int, Tuple[int, int]], pygame.Surface] = {}
+        lo, th = c - self.half_head, self.th_head
+        extend = c - self.half_head
+        for neck in (0, 1, 2, 4, 8):
+            for dr, dc in SIDE_BIT:
+                surf = body(neck)   # neck join; the head square covers the rest
+                pygame.draw.rect(surf, HEAD_CLR, (lo, lo, th, th))
+                # forward half‑cell extension
+                if dr:
+                    y = c + (self.half_head if dr > 0 else -self.half_head - extend)
+                    pygame.draw.rect(surf, HEAD_CLR, (lo, y, th, extend))
+                else:
+                    x = c + (self.half_head if dc > 0 else -self.half_head - extend)
+                    pygame.draw.rect(surf, HEAD_CLR, (x, lo, extend, th))
+                self._head_sprites[(neck, (dr, dc))] = surf
 
-    # ───────────────────── drawing helpers ─────────────────────────
     def _draw_snake(self):
         """
-        Draw body first, then head → head always appears on top.
+        One blits() of per-cell pieces; body and head never overlap.
         """
-        centres = [self._cell_center(r, c) for r, c in self.snake]
-        n       = len(centres)
+        snake, n = self.snake, len(self.snake)
         if n == 0:
             return
 
-        head_c   = centres[-1]          # last element
-        body_cs  = centres[:-1]         # everything except head
-
-        # 1) BODY squares
-        for cx, cy in body_cs:
-            pygame.draw.rect(
-                self.screen,
-                BODY_CLR,
-                pygame.Rect(cx - self.half_body, cy - self.half_body,
-                            self.th_body, self.th_body),
-            )
-
-        # 2) BODY ↔ BODY bridges
-        for i in range(1, n - 1):
-            self._bridge(body_cs[i - 1], body_cs[i], self.th_body, BODY_CLR)
-
-        # 3) NECK ↔ HEAD bridge (drawn with body thickness, trimmed)
-        if body_cs:
-            self._bridge(body_cs[-1], head_c, self.th_body, BODY_CLR, cut_back=True)
-
-        # 4) HEAD square (draw last so it overlays the neck join)
-        hx, hy = head_c
-        pygame.draw.rect(
-            self.screen,
-            HEAD_CLR,
-            pygame.Rect(hx - self.half_head, hy - self.half_head,
-                        self.th_head, self.th_head),
-        )
-
-        # 5) HEAD forward half‑cell extension (also on top)
-        dr, dc = self.direction
-        extend = self.cs // 2 - self.half_head
-        if dr:  # vertical
-            x = hx - self.half_head
-            y = hy + (self.half_head if dr > 0 else -self.half_head - extend)
-            pygame.draw.rect(self.screen, HEAD_CLR, (x, y, self.th_head, extend))
-        else:   # horizontal
-            y = hy - self.half_head
-            x = hx + (self.half_head if dc > 0 else -self.half_head - extend)
-            pygame.draw.rect(self.screen, HEAD_CLR, (x, y, extend, self.th_head))
+        bits = [0] * n
+        r0, c0 = snake[0]
+        for i, (r1, c1) in enumerate(islice(snake, 1, None), 1):
+            bits[i - 1] |= SIDE_BIT[(r1 - r0, c1 - c0)]
+            bits[i]     |= SIDE_BIT[(r0 - r1, c0 - c1)]
+            r0, c0 = r1, c1
+
+        ox, oy = self.board.origin
+        cs, sprites = self.cs, self._body_sprites
+        seq = [(sprites[b], (ox + c * cs, oy + r * cs))
+               for (r, c), b in zip(snake, bits[:-1])]
+        hr, hc = snake[-1]
+        seq.append((self._head_sprites[(bits[-1], self.direction)], (ox + hc * cs, oy + hr * cs)))
+        self.screen.blits(seq, doreturn=False)
 
     # ───────────────────────────── draw ────────────────────────────
     def draw(self):
@@ -280,13 +294,13 @@ class SnakeScene:
         pygame.draw.rect(self.screen, GRID_BORDER_CLR, board_rect, GRID_BORDER_W)
         self.board.draw(self.screen)
 
-        for f in self.foods:
+        for pos, f in self.foods.items():
             img = self.apple_img if f["type"] == "apple" else self.poison_img
-            self.screen.blit(img, self._cell_origin(*f["pos"]))
+            self.screen.blit(img, self._cell_origin(*pos))
 
         self._draw_snake()
 
-        elapsed = (time.time() - self.start_time) if not self.game_over else self.elapsed_when_end
+        elapsed = (pygame.time.get_ticks() - self.start_ms) if not self.game_over else self.elapsed_when_end
         hud = self.hud_font.render(
             f"{self.difficulty}  |  Length: {len(self.snake)}  |  Time: {self._fmt(elapsed)}",
             True, (255, 255, 255))
@@ -300,8 +314,8 @@ class SnakeScene:
 
     # ────────────────────────── utilities ──────────────────────────
     @staticmethod
-    def _fmt(sec: float) -> str:
-        s = int(sec); h, s = divmod(s, 3600); m, s = divmod(s, 60)
+    def _fmt(ms: int) -> str:
+        s = ms // 1000; h, s = divmod(s, 3600); m, s = divmod(s, 60)
         return f"{h:02}:{m:02}:{s:02}" if h else f"{m:02}:{s:02}"
 
 
@@ -6,7 +6,8 @@ Mouse-only controls via stacked DELETE/ENTER buttons (bottom-right).
 """
 
 from __future__ import annotations
-import random, time
+import random, string, time
+from collections import Counter
 from pathlib import Path
 from typing import List, Dict, Tuple
 import pygame
@@ -15,6 +16,7 @@ from boards.word_board import WordBoard
 from config            import WIDTH, HEIGHT, PROJECT_ROOT
 from constants         import MENU_BG_COLOR
 from ui.widgets        import Button
+from core.asset_manager import load_font
 
 # ───────── layout ─────────
 WORD_LEN, MAX_TRIES = 5, 6
@@ -22,6 +24,8 @@ TILE, GAP           = 56, 8                 # ↓ 64 → 56 px tiles
 GRID_W              = WORD_LEN*TILE + (WORD_LEN-1)*GAP
 GRID_X, GRID_Y      = (WIDTH-GRID_W)//2, 60
 GRID_BOTTOM         = GRID_Y + MAX_TRIES*TILE + (MAX_TRIES-1)*GAP
+TILE_XY             = tuple(tuple((GRID_X + c*(TILE+GAP), GRID_Y + r*(TILE+GAP))
+                                  for c in range(WORD_LEN)) for r in range(MAX_TRIES))
 
 # ───────── palette ─────────
 CLR_BG        = MENU_BG_COLOR
@@ -32,28 +36,28 @@ CLR_CORRECT   = (118,210,118)
 CLR_PRESENT   = (219,186, 60)
 CLR_KEY_BASE  = (110,110,110)
 CLR_KEY_USED  = ( 70, 70, 70)
+STATE_CLR     = {"correct": CLR_CORRECT, "present": CLR_PRESENT, "absent": CLR_KEY_USED}
 
 # ───────── word list ─────────
-_WORDS: List[str] | None = None
-def _load_words()->List[str]:
+_WORDS: Tuple[str, ...] | None = None
+def _load_words()->Tuple[str, ...]:
+    """Read once per process; a tuple so the shared list can't be mutated."""
     global _WORDS
     if _WORDS is None:
         path=PROJECT_ROOT/"data/words-5-letter.txt"
         with path.open(encoding="utf-8") as f:
-            _WORDS=[ln.strip().upper() for ln in f if len(ln.strip())==WORD_LEN]
+            _WORDS=tuple(w.upper() for w in map(str.strip, f) if len(w)==WORD_LEN)
         if not _WORDS: raise ValueError("words-5-letter.txt missing/empty")
     return _WORDS
 
 # ───────── scoring helper ─────────
 def score_guess(ans:str, g:str)->List[str]:
-    res,used=["absent"]*WORD_LEN,[False]*WORD_LEN
+    res,remaining=["absent"]*WORD_LEN,Counter(ans)   # answer letters not yet matched
+    for i,(a,ch) in enumerate(zip(ans,g)):
+        if a==ch: res[i]="correct"; remaining[ch]-=1
     for i,ch in enumerate(g):
-        if ch==ans[i]: res[i]="correct"; used[i]=True
-    for i,ch in enumerate(g):
-        if res[i]=="correct": continue
-        for j,a in enumerate(ans):
-            if not used[j] and ch==a:
-                res[i]="present"; used[j]=True; break
+        if res[i]!="correct" and remaining[ch]>0:
+            res[i]="present"; remaining[ch]-=1
     return res
 
 # ───────── scene ─────────
@@ -65,11 +69,15 @@ class WordItScene:
         self.guesses:List[str]=[]; self.results:List[List[str]]=[]
         self.current=""; self.game_over=False; self.win=False
         self.notice=""; self.notice_ts=0.0
+        # hard-mode constraints, accumulated guess by guess in _submit
+        self._greens:Dict[int,str]={}; self._yellows:set[str]=set(); self._greys:set[str]=set()
 
         pygame.font.init()
-        self.f_tile = pygame.font.Font(None, 56)   # matches 56-px tiles
-        self.f_title= pygame.font.Font(None, 52)
-        self.f_hud  = pygame.font.Font(None, 32)
+        self.f_tile = load_font(None, 56)   # matches 56-px tiles
+        self.f_title= load_font(None, 52)
+        self.f_hud  = load_font(None, 32)
+        # rendered text, keyed by (font id, text, colour)
+        self._glyph_cache:Dict[Tuple[int,str,Tuple[int,int,int]],pygame.Surface]={}
 
         # keyboard
         kb_size,kb_gap=40,6
@@ -88,8 +96,24 @@ class WordItScene:
         kb_y_under = GRID_BOTTOM + 20
         kb_y_above = btn_del_y   - kb_h + 50
         self.kb.origin = ((WIDTH-kb_w)//2, min(kb_y_under, kb_y_above))
-
-        self.key_clr:Dict[str,Tuple[int,int,int]]={}
+        ox, oy = self.kb.origin
+        self._key_rects:Dict[str,pygame.Rect]={
+            ch: base.inflate(-4,-4).move(ox,oy+30)
+            for ch, base in self.kb._keyboard_rects.items()}
+
+        self.key_state:Dict[str,str]={}   # best score seen per letter
+        for font in (self.f_tile, self.kb.font):
+            for ch in string.ascii_uppercase:
+                for col in (CLR_TEXT, CLR_TEXT_FADE):
+                    self._glyph(font, ch, col)
+        self._build_tile_bgs()
+        # static frame, rebuilt on submit / notice / game over (see _build_chrome)
+        self._chrome: pygame.Surface | None = None
+        self._chrome_dirty = True
+        self._timer_cache: Tuple[int, pygame.Surface] | None = None
+        # what the screen shows on top of the chrome, for dirty rects
+        self._timer_rect = pygame.Rect(10, 15, 0, 0)
+        self._shown_current = ""
         self.restart_btn=self.back_btn=None
         self._build_end_buttons()
 
@@ -97,6 +121,7 @@ class WordItScene:
 
     # ───────── utilities ─────────
     def _build_end_buttons(self):
+        self._chrome_dirty = True
         if not self.game_over:
             self.restart_btn = self.back_btn = None
             return
@@ -105,29 +130,51 @@ class WordItScene:
         self.restart_btn = Button(pygame.Rect(cx-w-20, y, w, h), "Restart")
         self.back_btn    = Button(pygame.Rect(cx+20,  y, w, h), "Back")
 
+    def _build_tile_bgs(self):
+        """Grid tiles (bare and lettered) and keyboard keys, border baked in."""
+        self._tile_bg: Dict[Tuple[int,int,int], pygame.Surface] = {}
+        for col in (CLR_KEY_BASE, *STATE_CLR.values()):
+            surf = pygame.Surface((TILE, TILE)).convert()
+            surf.fill(col)
+            pygame.draw.rect(surf, CLR_BORDER, surf.get_rect(), 2)
+            self._tile_bg[col] = surf
+        # finished tiles, letter included, so a tile is a single blit
+        self._tile_atlas: Dict[Tuple[str,str], pygame.Surface] = {}
+        for state, col in (("empty", CLR_KEY_BASE), *STATE_CLR.items()):
+            fg = CLR_TEXT if col != CLR_KEY_USED else CLR_TEXT_FADE
+            for ch in string.ascii_uppercase:
+                surf = self._tile_bg[col].copy()
+                g = self._glyph(self.f_tile, ch, fg)
+                surf.blit(g, g.get_rect(center=(TILE//2, TILE//2)))
+                self._tile_atlas[(ch, state)] = surf
+        # keys have rounded corners, so these keep alpha; only unused
+        # keys get an outline
+        ks = self.kb.slot_size - 4
+        self._key_bg: Dict[Tuple[int,int,int], pygame.Surface] = {}
+        for col in (CLR_KEY_BASE, *STATE_CLR.values()):
+            surf = pygame.Surface((ks, ks), pygame.SRCALPHA)
+            pygame.draw.rect(surf, col, surf.get_rect(), border_radius=6)
+            if col == CLR_KEY_BASE:
+                pygame.draw.rect(surf, CLR_BORDER, surf.get_rect(), 1, border_radius=6)
+            self._key_bg[col] = surf
+
     def _state_of_key(self, ch: str) -> str | None:
-        c = self.key_clr.get(ch)
-        if c == CLR_CORRECT:  return "correct"
-        if c == CLR_PRESENT:  return "present"
-        if c == CLR_KEY_USED: return "absent"
-        return None
+        return self.key_state.get(ch)
 
     # ───────── hard-mode rule check ─────────
-    def _validate_hard(self, guess: str) -> Tuple[bool,str]:
-        greens: Dict[int,str] = {}
-        yellows: set[str] = set()
-        greys:   set[str] = set()
-
-        for g, sc in zip(self.guesses, self.results):
-            for idx, (ch, code) in enumerate(zip(g, sc)):
-                if code == "correct":
-                    greens[idx] = ch
-                elif code == "present":
-                    yellows.add(ch)
-                elif code == "absent":
-                    if ch not in greens.values() and ch not in yellows:
-                        greys.add(ch)
+    def _learn(self, guess: str, sc: List[str]):
+        greens, yellows = self._greens, self._yellows
+        for idx, (ch, code) in enumerate(zip(guess, sc)):
+            if code == "correct":
+                greens[idx] = ch
+            elif code == "present":
+                yellows.add(ch)
+            elif code == "absent":
+                if ch not in greens.values() and ch not in yellows:
+                    self._greys.add(ch)
 
+    def _validate_hard(self, guess: str) -> Tuple[bool,str]:
+        greens, yellows, greys = self._greens, self._yellows, self._greys
         for idx, ch in greens.items():
             if guess[idx] != ch:
                 return False, "Keep green letters in place"
@@ -139,6 +186,7 @@ class WordItScene:
 
     def _notify(self, msg: str):
         self.notice, self.notice_ts = msg, time.time()
+        self._chrome_dirty = True
 
     # ───────── accept / reject guess ─────────
     def _submit(self):
@@ -154,13 +202,12 @@ class WordItScene:
 
         sc = score_guess(self.answer, g)
         self.guesses.append(g); self.results.append(sc)
+        self._learn(g, sc)
 
         priority = {"absent":1,"present":2,"correct":3}
         for ch, code in zip(g, sc):
             if priority[code] > priority.get(self._state_of_key(ch) or "", 0):
-                self.key_clr[ch] = (CLR_CORRECT if code=="correct"
-                                    else CLR_PRESENT if code=="present"
-                                    else CLR_KEY_USED)
+                self.key_state[ch] = code
 
         self.current = ""
         if g == self.answer: self.win = self.game_over = True
@@ -203,74 +250,106 @@ class WordItScene:
             self.elapsed = time.time() - self.start_time
         if self.notice and (time.time() - self.notice_ts > 2):
             self.notice = ""
+            self._chrome_dirty = True
 
     # ───────── drawing helpers ─────────
     def _tile_rect(self, r, c): return pygame.Rect(
         GRID_X + c*(TILE+GAP), GRID_Y + r*(TILE+GAP), TILE, TILE)
 
-    def _blit(self, font, text, pos, col=CLR_TEXT):
-        surf = font.render(text, True, col)
-        self.screen.blit(surf, surf.get_rect(center=pos))
+    def _glyph(self, font, text, col=CLR_TEXT) -> pygame.Surface:
+        key = (id(font), text, col)
+        surf = self._glyph_cache.get(key)
+        if surf is None:
+            surf = self._glyph_cache[key] = font.render(text, True, col).convert_alpha()
+        return surf
+
+    def _blit(self, dst, font, text, pos, col=CLR_TEXT):
+        surf = self._glyph(font, text, col)
+        dst.blit(surf, surf.get_rect(center=pos))
 
     # ───────── draw sections ─────────
-    def _draw_grid(self):
-        for r,(g,sc) in enumerate(zip(self.guesses, self.results)):
-            for c,ch in enumerate(g):
-                rect = self._tile_rect(r,c)
-                col  = CLR_CORRECT if sc[c]=="correct" else CLR_PRESENT if sc[c]=="present" else CLR_KEY_USED
-                pygame.draw.rect(self.screen, col, rect)
-                pygame.draw.rect(self.screen, CLR_BORDER, rect, 2)
-                fg = CLR_TEXT if col != CLR_KEY_USED else CLR_TEXT_FADE
-                self._blit(self.f_tile, ch, rect.center, fg)
+    def _glyph_at(self, font, ch, center, col=CLR_TEXT):
+        surf = self._glyph(font, ch, col)
+        return surf, surf.get_rect(center=center)
+
+    def _draw_grid(self, dst):
+        """Scored rows and empty tiles; the row being typed is overlaid later."""
+        atlas, blank = self._tile_atlas, self._tile_bg[CLR_KEY_BASE]
+        tiles = [(atlas[(ch, sc[c])], TILE_XY[r][c])
+                 for r,(g,sc) in enumerate(zip(self.guesses, self.results))
+                 for c,ch in enumerate(g)]
+        tiles += [(blank, xy) for row in TILE_XY[len(self.guesses):] for xy in row]
+        dst.blits(tiles, doreturn=False)
+
+    def _draw_current(self):
         r = len(self.guesses)
         if r < MAX_TRIES:
-            for c in range(WORD_LEN):
-                rect = self._tile_rect(r,c)
-                pygame.draw.rect(self.screen, CLR_KEY_BASE, rect)
-                pygame.draw.rect(self.screen, CLR_BORDER, rect, 2)
-                if c < len(self.current):
-                    self._blit(self.f_tile, self.current[c], rect.center)
-        for rr in range(len(self.guesses)+1, MAX_TRIES):
-            for cc in range(WORD_LEN):
-                rect = self._tile_rect(rr,cc)
-                pygame.draw.rect(self.screen, CLR_KEY_BASE, rect)
-                pygame.draw.rect(self.screen, CLR_BORDER, rect, 2)
-
-    def _draw_keyboard(self):
-        self.kb.draw(self.screen)
-        ox, oy = self.kb.origin; kb_y = oy + 30
-        for ch, base in self.kb._keyboard_rects.items():
-            if ch not in self.key_clr:
-                rect = base.inflate(-4,-4).move(ox,kb_y)
-                pygame.draw.rect(self.screen, CLR_KEY_BASE, rect, border_radius=6)
-                pygame.draw.rect(self.screen, CLR_BORDER,   rect, 1, border_radius=6)
-                self._blit(self.kb.font, ch, rect.center)
-        for ch, col in self.key_clr.items():
-            rect = self.kb._keyboard_rects[ch].inflate(-4,-4).move(ox,kb_y)
-            pygame.draw.rect(self.screen, col, rect, border_radius=6)
+            atlas, row = self._tile_atlas, TILE_XY[r]
+            self.screen.blits([(atlas[(ch, "empty")], row[c])
+                               for c, ch in enumerate(self.current)], doreturn=False)
+
+    def _draw_keyboard(self, dst):
+        self.kb.draw(dst)
+        bgs, letters = [], []
+        for ch, rect in self._key_rects.items():
+            state = self.key_state.get(ch)
+            col   = STATE_CLR[state] if state else CLR_KEY_BASE
+            bgs.append((self._key_bg[col], rect.topleft))
             fg = CLR_TEXT if col != CLR_KEY_USED else CLR_TEXT_FADE
-            self._blit(self.kb.font, ch, rect.center, fg)
-
-    # ───────── main draw ─────────
-    def draw(self):
-        self.screen.fill(CLR_BG)
+            letters.append(self._glyph_at(self.kb.font, ch, rect.center, fg))
+        dst.blits(bgs, doreturn=False)
+        dst.blits(letters, doreturn=False)
+
+    def _build_chrome(self):
+        """Everything except the timer and the typed letters, on one Surface."""
+        if self._chrome is None:
+            self._chrome = pygame.Surface(self.screen.get_size()).convert()
+        dst = self._chrome
+        dst.fill(CLR_BG)
         title = ("You Win!" if self.win else
                  "You Lose!" if self.game_over else
                  ("WordIt – Hard" if self.hard_mode else "WordIt"))
-        self._blit(self.f_title, title, (WIDTH//2, 25))
+        self._blit(dst, self.f_title, title, (WIDTH//2, 25))
         if self.game_over and not self.win:
-            self._blit(self.f_hud, f"Answer: {self.answer}", (WIDTH//2, 65))
-        self.screen.blit(self.f_hud.render(f"{int(self.elapsed):03d}s",True,CLR_TEXT), (10,15))
-        self._draw_grid()
+            self._blit(dst, self.f_hud, f"Answer: {self.answer}", (WIDTH//2, 65))
+        self._draw_grid(dst)
         if self.notice:
-            self._blit(self.f_hud, self.notice,
+            self._blit(dst, self.f_hud, self.notice,
                        (WIDTH//2, GRID_BOTTOM + 50), CLR_PRESENT)
         if not self.game_over:
-            self._draw_keyboard()
-            self.del_btn.draw(self.screen); self.enter_btn.draw(self.screen)
+            self._draw_keyboard(dst)
+            self.del_btn.draw(dst); self.enter_btn.draw(dst)
         else:
-            if self.restart_btn: self.restart_btn.draw(self.screen)
-            if self.back_btn:    self.back_btn.draw(self.screen)
+            if self.restart_btn: self.restart_btn.draw(dst)
+            if self.back_btn:    self.back_btn.draw(dst)
+        self._chrome_dirty = False
+
+    # ───────── main draw ─────────
+    def draw(self):
+        # between chrome rebuilds only the timer and the typed row change
+        full = self._chrome_dirty
+        if full:
+            self._build_chrome()
+            self.screen.blit(self._chrome, (0, 0))
+        dirty: List[pygame.Rect] = []
+        sec = int(self.elapsed)             # label only changes once a second
+        if full or self._timer_cache is None or self._timer_cache[0] != sec:
+            if self._timer_cache is None or self._timer_cache[0] != sec:
+                self._timer_cache = (sec, self.f_hud.render(f"{sec:03d}s", True, CLR_TEXT))
+            label = self._timer_cache[1]
+            area  = self._timer_rect.union(label.get_rect(topleft=(10,15)))
+            self._timer_rect = label.get_rect(topleft=(10,15))
+            self.screen.blit(self._chrome, area, area)
+            self.screen.blit(label, (10,15))
+            dirty.append(area)
+        r = len(self.guesses)
+        if r < MAX_TRIES and (full or self.current != self._shown_current):
+            area = self._tile_rect(r,0).union(self._tile_rect(r,WORD_LEN-1))
+            self.screen.blit(self._chrome, area, area)
+            self._draw_current()
+            dirty.append(area)
+        self._shown_current = self.current
+        return None if full else dirty
 
 
 # ───────── registry hook ─────────
@@ -24,7 +24,7 @@ from constants            import (
     TITLE_MAX_W, TITLE_MARGIN_TOP,
 )
 from ui.widgets          import DraggableIcon, Button, Dropdown
-from core.asset_manager  import AssetManager
+from core.asset_manager  import AssetManager, load_font
 from core.game_registry  import GameRegistry
 
 # ────────────────────────────────────────────────────────────────────────
@@ -43,15 +43,19 @@ COMBOS = {
     tuple(sorted(["wordit", "bricklayer"])):       ("Word Salad",   "wordsalad.svg"),
     tuple(sorted(["pairs", "bricklayer"])):        ("Bailout",      "bailout.svg"),
 }
-COMBINED_NAMES = {name.lower() for name, _ in COMBOS.values()}
+COMBINED_NAMES = frozenset(name.lower() for name, _ in COMBOS.values())
+# same table keyed by unordered pair, so a lookup needs no sorting
+COMBOS_FS = {frozenset(k): v for k, v in COMBOS.items()}
 
 # ────────────────────────────────────────────────────────────────────────
 class MenuUI:
+    wants_motion = True        # cover/scrollbar dragging needs MOUSEMOTION
+
     def __init__(self, screen: pygame.Surface, registry: GameRegistry, assets: AssetManager):
         self.screen   = screen
         self.registry = registry
         self.assets   = assets
-        self.font     = pygame.font.Font(FONT_NAME, 18)
+        self.font     = load_font(FONT_NAME, 18)
 
         # Title banner ------------------------------------------------------
         title_img      = pygame.image.load(PROJECT_ROOT / "assets" / "title.png").convert_alpha()
@@ -99,6 +103,15 @@ class MenuUI:
 
         self.full_strip_width = ICON_SPACING + len(self.icons)*(ICON_SIZE[0] + ICON_SPACING)
         self.scroll_offset    = 0
+        # scrollbar geometry: the track never moves, the thumb only on scroll
+        self._cached_track = pygame.Rect(
+            self.scroll_rect.x,
+            self.scroll_rect.bottom - SCROLLBAR_HEIGHT,
+            self.scroll_rect.width,
+            SCROLLBAR_HEIGHT
+        )
+        self._cached_max   = max(0, self.full_strip_width - self.scroll_rect.width)
+        self._cached_thumb: pygame.Rect|None = None
         self._update_icon_positions()
 
         # Scrollbar drag state --------------------------------------------
@@ -111,15 +124,20 @@ class MenuUI:
         self.play_btn : Button|None = None
         self.mix_btn  : Button|None = None
         self.dropdown : Dropdown|None = None
+        # strip-sized covers by name; mixed games are added on first use
+        self._small_icon_cache: Dict[str, pygame.Surface] = {
+            icon.name: icon.surface for icon in self.icons}
+        self._sel_blits: List[Tuple[pygame.Surface, Tuple[int,int]]] = []
         self._rebuild_buttons()
 
         # Drag state -------------------------------------------------------
         self.drag_icon           : DraggableIcon|None = None
         self.drag_from_selection = False
+        self._drag_pool          : DraggableIcon|None = None   # reused for selection drags
 
     # ───────────────────────────────────────────────────────── layout ─────
     def _max_offset(self) -> int:
-        return max(0, self.full_strip_width - self.scroll_rect.width)
+        return self._cached_max
 
     def _update_icon_positions(self):
         y = (
@@ -129,16 +147,23 @@ class MenuUI:
         for icon in self.icons:
             x = ICON_SPACING + icon.index*(ICON_SIZE[0]+ICON_SPACING) - self.scroll_offset
             icon.rect.topleft = (x, y)
+        self._cached_thumb = None
+        # culled here, once per scroll, rather than on every frame; the
+        # rects are live, so a strip icon being dragged still follows
+        self._strip_blits = [
+            (icon.surface, icon.rect) for icon in self.icons
+            if icon.rect.right >= 0 and icon.rect.left <= WIDTH
+        ]
 
     def _track_rect(self) -> pygame.Rect:
-        return pygame.Rect(
-            self.scroll_rect.x,
-            self.scroll_rect.bottom - SCROLLBAR_HEIGHT,
-            self.scroll_rect.width,
-            SCROLLBAR_HEIGHT
-        )
+        return self._cached_track
 
     def _thumb_rect(self) -> pygame.Rect:
+        if self._cached_thumb is None:
+            self._cached_thumb = self._compute_thumb()
+        return self._cached_thumb
+
+    def _compute_thumb(self) -> pygame.Rect:
         track = self._track_rect()
         m     = self._max_offset()
         if m == 0:
@@ -167,7 +192,28 @@ class MenuUI:
                 self.selected[1]: (cx + 10,                cy - ICON_SIZE[1]//2),
             }
 
+    def _small_icon(self, nm: str) -> pygame.Surface:
+        surf = self._small_icon_cache.get(nm)
+        if surf is None:
+            surf = self._small_icon_cache[nm] = self.assets.get_icon(
+                self.registry.cover_file(nm), ICON_SIZE)
+        return surf
+
+    def _cache_selection(self):
+        """(surface, pos) for the icons in the combo box; redone on change."""
+        if len(self.selected) == 1:
+            big = self.assets.get_icon(
+                self.registry.cover_file(self.selected[0]),
+                (ICON_SIZE[0]*2, ICON_SIZE[1]*2)
+            )
+            self._sel_blits = [(big, big.get_rect(center=self.drop_rect.center).topleft)]
+        else:
+            self._sel_blits = [
+                (self._small_icon(nm), self.snap_pos[nm]) for nm in self.selected
+            ]
+
     def _rebuild_buttons(self):
+        self._cache_selection()
         self.play_btn = self.mix_btn = None
         self.dropdown = None
 
@@ -204,11 +250,8 @@ class MenuUI:
             )
 
     def _attempt_mix(self):
-        key = tuple(sorted([s.lower() for s in self.selected]))
-        if key in COMBOS:
-            name, file = COMBOS[key]
-        else:
-            name, file = "Failed Mix", "fail.svg"
+        name, file = COMBOS_FS.get(frozenset(s.lower() for s in self.selected),
+                                   ("Failed Mix", "fail.svg"))
         if name not in self.registry.all_games():
             self.registry.register(name, file)
         self.selected = [name]
@@ -251,10 +294,11 @@ class MenuUI:
             # drag from selection
             for nm, pos in list(self.snap_pos.items()):
                 if pygame.Rect(pos, ICON_SIZE).collidepoint(ev.pos):
-                    surf = self.assets.get_icon(
-                        self.registry.cover_file(nm), ICON_SIZE
-                    )
-                    tmp  = DraggableIcon(nm, surf, -1)
+                    surf = self._small_icon(nm)
+                    tmp = self._drag_pool
+                    if tmp is None:
+                        tmp = self._drag_pool = DraggableIcon(nm, surf, -1)
+                    tmp.name, tmp.surface = nm, surf
                     tmp.rect.topleft = pos
                     tmp.start_drag(ev.pos)
                     self.drag_icon = tmp
@@ -352,29 +396,13 @@ class MenuUI:
         pygame.draw.rect(self.screen, DROP_BORDER_COLOR, self.drop_rect, width=3)
 
         # selected icons
-        if len(self.selected) == 1:
-            nm  = self.selected[0]
-            big = self.assets.get_icon(
-                self.registry.cover_file(nm),
-                (ICON_SIZE[0]*2, ICON_SIZE[1]*2)
-            )
-            rect = big.get_rect(center=self.drop_rect.center)
-            self.screen.blit(big, rect.topleft)
-        else:
-            for nm in self.selected:
-                surf = self.assets.get_icon(
-                    self.registry.cover_file(nm), ICON_SIZE
-                )
-                self.screen.blit(surf, self.snap_pos[nm])
+        self.screen.blits(self._sel_blits, doreturn=False)
 
         # scroll strip bg
         pygame.draw.rect(self.screen, SCROLL_BG_COLOR, self.scroll_rect)
 
-        # strip icons
-        for icon in self.icons:
-            if icon.rect.right < 0 or icon.rect.left > WIDTH:
-                continue
-            icon.draw(self.screen)
+        # strip icons – one batch; the dragged one is drawn again on top below
+        self.screen.blits(self._strip_blits, doreturn=False)
 
         # dragging icon
         if self.drag_icon:
@@ -3,31 +3,76 @@ Reusable UI widgets (buttons & draggable icons/games).
 """
 from __future__ import annotations
 import pygame
-from typing import Tuple
+from typing import Sequence, Tuple
 from config    import ICON_SIZE, FONT_NAME
+from core.asset_manager import load_font
 from constants import (BUTTON_BG_COLOR, BUTTON_MIX_BG_COLOR,
                        BUTTON_FG_COLOR)
 
+# rendered labels, shared by every widget – blit them, never draw onto them
+# (keyed on the font itself, not id(), so a recycled id can't alias)
+_LABEL_CACHE: dict[tuple[str, tuple, pygame.font.Font], pygame.Surface] = {}
+_LABEL_CACHE_MAX = 256
+
+def _render_label(font: pygame.font.Font, text: str, fg) -> pygame.Surface:
+    key = (text, tuple(fg), font)
+    lbl = _LABEL_CACHE.get(key)
+    if lbl is None:
+        if len(_LABEL_CACHE) >= _LABEL_CACHE_MAX:
+            _LABEL_CACHE.pop(next(iter(_LABEL_CACHE)))      # oldest first
+        lbl = font.render(text, True, fg)
+        if pygame.display.get_surface() is not None:
+            lbl = lbl.convert_alpha()                       # display format
+        _LABEL_CACHE[key] = lbl
+    return lbl
+
 # --------------------------------------------------------------------
 class Button:
+    __slots__ = ("rect", "_text", "_bg", "_fg", "surface")
+
     def __init__(self, rect: pygame.Rect, text: str,
                  bg=BUTTON_BG_COLOR, fg=BUTTON_FG_COLOR):
-        self.rect = rect
-        self.text = text
-        self.bg   = bg
-        self.fg   = fg
-
-        font = pygame.font.Font(FONT_NAME, 20)
-        self.surface = pygame.Surface(rect.size, pygame.SRCALPHA)
-        self.surface.fill(bg)
-        lbl = font.render(text, True, fg)
-        self.surface.blit(lbl, lbl.get_rect(center=self.surface.get_rect().center))
+        self.rect  = rect
+        self._text = text
+        self._bg   = bg
+        self._fg   = fg
+        # rendered on first draw, so buttons that never show cost nothing;
+        # the setters below drop it, so it is re-rendered lazily too
+        self.surface: pygame.Surface | None = None
+
+    @property
+    def text(self) -> str: return self._text
+    @text.setter
+    def text(self, value: str) -> None: self._text, self.surface = value, None
+
+    @property
+    def bg(self): return self._bg
+    @bg.setter
+    def bg(self, value) -> None: self._bg, self.surface = value, None
 
-    def draw(self, screen):  screen.blit(self.surface, self.rect.topleft)
+    @property
+    def fg(self): return self._fg
+    @fg.setter
+    def fg(self, value) -> None: self._fg, self.surface = value, None
+
+    def _build(self) -> pygame.Surface:
+        font = load_font(FONT_NAME, 20)
+        surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        surf.fill(self._bg)
+        lbl = _render_label(font, self._text, self._fg)
+        surf.blit(lbl, lbl.get_rect(center=surf.get_rect().center))
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert_alpha()
+        self.surface = surf
+        return surf
+
+    def draw(self, screen):  screen.blit(self.surface or self._build(), self.rect.topleft)
     def hovered(self, pos):  return self.rect.collidepoint(pos)
 
 # --------------------------------------------------------------------
 class DraggableIcon:
+    __slots__ = ("name", "surface", "index", "rect", "dragging", "_ox", "_oy")
+
     def __init__(self, name: str, surface: pygame.Surface, index: int):
         self.name    = name
         self.surface = surface
@@ -35,19 +80,17 @@ class DraggableIcon:
         self.rect    = pygame.Rect(0, 0, *ICON_SIZE)
 
         self.dragging = False
-        self._offset  = (0, 0)
+        self._ox = self._oy = 0         # grab point inside the icon
 
     # -------------------------------------------------------------- #
     def start_drag(self, mouse_pos):
-        mx,my = mouse_pos
-        ox,oy = self.rect.topleft
-        self._offset = (mx-ox, my-oy)
+        self._ox = mouse_pos[0] - self.rect.x
+        self._oy = mouse_pos[1] - self.rect.y
         self.dragging = True
 
     def drag(self, mouse_pos):
-        mx,my = mouse_pos
-        ox,oy = self._offset
-        self.rect.topleft = (mx-ox, my-oy)
+        self.rect.x = mouse_pos[0] - self._ox
+        self.rect.y = mouse_pos[1] - self._oy
 
     def stop_drag(self):
         self.dragging = False
@@ -59,78 +102,130 @@ class Dropdown:
     """
     A simple dropdown: click to open/close, click an option to select it.
     """
+    __slots__ = ("rect", "options", "_font", "_bg", "_fg", "_hl", "open", "_selected",
+                 "_n", "_selected_idx", "_label_blits",
+                 "_closed_surface", "_open_surface")
+
     def __init__(
         self,
         rect: pygame.Rect,
-        options: list[str],
+        options: Sequence[str],
         font: pygame.font.Font,
         bg=(60,60,60),
         fg=(220,220,220),
         highlight=(100,100,100),
     ):
         self.rect      = rect
-        self.options   = options
-        self.font      = font
-        self.bg        = bg
-        self.fg        = fg
-        self.hl       = highlight
+        self.options   = tuple(options)     # fixed for the widget's lifetime
+        self._n        = len(self.options)
+        self._font     = font
+        self._bg       = bg
+        self._fg       = fg
+        self._hl       = highlight
         self.open      = False
-        self.selected  = options[0] if options else ""
-        # pre-render labels
-        self._labels = [self.font.render(opt, True, fg) for opt in options]
+        self._selected = self.options[0] if options else ""
+        self._selected_idx = 0 if options else -1
+        # option labels, each with its top-left offset inside a row
+        self._label_blits: tuple | None = None
+        # header (bg + current label + arrow) and the option rows below it;
+        # built on first draw, dropped by the setters below
+        self._closed_surface: pygame.Surface | None = None
+        self._open_surface: pygame.Surface | None = None
+
+    # changing how the dropdown looks or what it shows invalidates the caches
+    def _restyle(self) -> None:
+        self._label_blits = self._closed_surface = self._open_surface = None
+
+    @property
+    def font(self) -> pygame.font.Font: return self._font
+    @font.setter
+    def font(self, value: pygame.font.Font) -> None: self._font = value; self._restyle()
+
+    @property
+    def bg(self): return self._bg
+    @bg.setter
+    def bg(self, value) -> None: self._bg = value; self._restyle()
+
+    @property
+    def fg(self): return self._fg
+    @fg.setter
+    def fg(self, value) -> None: self._fg = value; self._restyle()
+
+    @property
+    def hl(self): return self._hl
+    @hl.setter
+    def hl(self, value) -> None: self._hl = value; self._open_surface = None
+
+    @property
+    def selected(self) -> str: return self._selected
+    @selected.setter
+    def selected(self, value: str) -> None:
+        self._selected     = value
+        self._selected_idx = self.options.index(value) if value in self.options else -1
+        self._closed_surface = self._open_surface = None
 
     def handle_event(self, event):
-        if not self.options:
+        if not self._n:
             return False
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self.open:
-                # check each option
-                for idx, opt in enumerate(self.options):
-                    opt_rect = pygame.Rect(
-                        self.rect.x,
-                        self.rect.y + (idx+1)*self.rect.height,
-                        self.rect.width,
-                        self.rect.height,
-                    )
-                    if opt_rect.collidepoint(event.pos):
-                        self.selected = opt
-                        self.open = False
-                        return True
-                # clicked outside options: close
-                if not self.rect.collidepoint(event.pos):
+                # rows are stacked under the header at a fixed pitch, so the
+                # option index is pure arithmetic
+                r      = self.rect
+                ex, ey = event.pos
+                row    = (ey - r.y) // r.height
+                if not (r.x <= ex < r.right and 0 <= row <= self._n):
+                    # clicked outside header and options: close
                     self.open = False
                     return False
+                if row:
+                    self.selected = self.options[row - 1]
+                    self.open = False
+                    return True
             else:
                 if self.rect.collidepoint(event.pos):
                     self.open = True
                     return True
         return False
 
-    def draw(self, screen):
-        # draw current
-        pygame.draw.rect(screen, self.bg, self.rect)
-        lbl = self.font.render(self.selected, True, self.fg)
-        screen.blit(lbl, lbl.get_rect(center=self.rect.center))
-        # draw arrow
+    def _rebuild_closed(self) -> pygame.Surface:
+        surf = pygame.Surface(self.rect.size)
+        surf.fill(self._bg)
+        box = surf.get_rect()
+        lbl = _render_label(self._font, self._selected, self._fg)
+        surf.blit(lbl, lbl.get_rect(center=box.center))
+        # arrow
         pygame.draw.polygon(
-            screen,
-            self.fg,
+            surf,
+            self._fg,
             [
-                (self.rect.right - 12, self.rect.centery - 4),
-                (self.rect.right - 4, self.rect.centery - 4),
-                (self.rect.right - 8, self.rect.centery + 4),
+                (box.right - 12, box.centery - 4),
+                (box.right - 4, box.centery - 4),
+                (box.right - 8, box.centery + 4),
             ],
         )
+        self._closed_surface = surf
+        return surf
+
+    def _rebuild_open(self) -> pygame.Surface:
+        w, h = self.rect.size
+        if self._label_blits is None:
+            row = pygame.Rect(0, 0, w, h)
+            self._label_blits = tuple(
+                (lbl, lbl.get_rect(center=row.center).topleft)
+                for lbl in (_render_label(self._font, opt, self._fg) for opt in self.options)
+            )
+        surf = pygame.Surface((w, h*self._n))
+        for idx, (label, (lx, ly)) in enumerate(self._label_blits):
+            surf.fill(self._hl if idx == self._selected_idx else self._bg,
+                      (0, idx*h, w, h))
+            surf.blit(label, (lx, idx*h + ly))
+        self._open_surface = surf
+        return surf
+
+    def draw(self, screen):
+        # draw current
+        screen.blit(self._closed_surface or self._rebuild_closed(), self.rect.topleft)
         # draw options if open
-        if self.open:
-            for idx, label in enumerate(self._labels):
-                opt_rect = pygame.Rect(
-                    self.rect.x,
-                    self.rect.y + (idx+1)*self.rect.height,
-                    self.rect.width,
-                    self.rect.height,
-                )
-                # use the string in self.options, not label.get_text()
-                bg_color = self.hl if self.options[idx] == self.selected else self.bg
-                pygame.draw.rect(screen, bg_color, opt_rect)
-                screen.blit(label, label.get_rect(center=opt_rect.center))
\ No newline at end of file
+        if self.open and self._n:
+            screen.blit(self._open_surface or self._rebuild_open(), self.rect.bottomleft)
\ No newline at end of file